@@ -1,24 +1,31 @@
 from abc import ABC, abstractmethod
+from functools import cache
+from typing import Callable, Sequence
 
 
 class AbstractSchema(ABC):
+    # Small, rarely changing lookup tables (states, types, ...) can set this to keep their rows cached across calls
+    # when they are resolved as foreign keys. The cache is cleared by every write through a table, holds up to
+    # REFERENCE_CACHE_SIZE rows per table and is shared by all threads. The cached objects are handed to every
+    # caller resolving them, so they must not be modified, a change would show up in all later results.
+    cacheable: bool = False
 
     def __init__(self, alias: str):
         self._alias = alias
+        self._sql_cache: dict[tuple, str] = {}
+        # the alias fragments are read by select and table_name of every query, so they are formatted once
+        self._alias_prefix = f"{alias}." if alias else ""
+        self._alias_suffix = f" AS {alias}" if alias else ""
 
     @property
     def alias(self) -> str:
         return self._alias or ""
 
     def _alias_internal(self) -> str:
-        if self._alias:
-            return f"{self._alias}."
-        return ""
+        return self._alias_prefix
 
     def _alias_external(self) -> str:
-        if self._alias:
-            return f" AS {self._alias}"
-        return ""
+        return self._alias_suffix
 
     @property
     @abstractmethod
@@ -37,14 +44,103 @@ class AbstractSchema(ABC):
 
     @property
     @abstractmethod
-    def columns(self) -> list[str]:
+    def columns(self) -> Sequence[str]:
+        """
+        The column names of the table. They are shared by all callers and must not be mutated, a tuple is preferred.
+        """
         ...
 
     @property
     @abstractmethod
-    def primaryKey(self) -> list[str]:
+    def primaryKey(self) -> Sequence[str]:
+        """
+        The primary key column names of the table. Like columns they must not be mutated.
+        """
         ...
 
     @classmethod
+    @cache
     def without_alias(cls) -> "AbstractSchema":
+        """
+        Returns the schema without an alias. The instance is shared per schema class, so its statement cache is kept.
+        """
         return cls("")
+
+    def select_all_sql(self) -> str:
+        """
+        Returns the SELECT statement for all rows of the table.
+        """
+        return self._cached_sql(("SELECT_ALL",), lambda: f"SELECT * FROM {self.table_name};")
+
+    def select_sql(self, columns: Sequence[str] | None = None) -> str:
+        """
+        Returns the SELECT statement for the given columns of the table without a WHERE clause.
+        Without columns all columns are selected.
+        """
+        columns = tuple(columns) if columns else ()
+        return self._cached_sql(
+            ("SELECT", columns),
+            lambda: f"SELECT {', '.join(columns) if columns else '*'} FROM {self.table_name}"
+        )
+
+    def select_where_sql(self) -> str:
+        """
+        Returns the start of a SELECT statement for all columns of the table, to be followed by a condition.
+        """
+        return self._cached_sql(("SELECT_WHERE",), lambda: f"SELECT * FROM {self.table_name_no_alias} WHERE")
+
+    def insert_sql(self, columns: Sequence[str]) -> str:
+        """
+        Returns the INSERT statement for the given columns.
+        """
+        return self._cached_sql(
+            ("INSERT", tuple(columns)),
+            lambda: f"INSERT INTO {self.table_name_no_alias} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+
+    def update_sql(self, columns: Sequence[str]) -> str:
+        """
+        Returns the UPDATE statement for the given columns, restricted to a single primary key.
+        """
+        return self._cached_sql(
+            ("UPDATE", tuple(columns)),
+            lambda: f"UPDATE {self.table_name_no_alias} SET {', '.join([f'{col} = ?' for col in columns])} "
+                    f"{self.where_pk_sql()}"
+        )
+
+    def upsert_sql(self, insert_columns: Sequence[str], update_columns: Sequence[str]) -> str:
+        """
+        Returns the INSERT statement for the given columns that updates the update columns of an existing row instead.
+        """
+        return self._cached_sql(
+            ("UPSERT", tuple(insert_columns), tuple(update_columns)),
+            lambda: f"{self.insert_sql(insert_columns)} "
+                    f"ON CONFLICT ({', '.join(self.primaryKey)}) DO UPDATE "
+                    f"SET {', '.join([f'{col} = ?' for col in update_columns])} "
+                    f"{self.where_pk_sql()}"
+        )
+
+    def delete_sql(self) -> str:
+        """
+        Returns the DELETE statement for a single primary key.
+        """
+        return self._cached_sql(("DELETE",), lambda: f"DELETE FROM {self.table_name_no_alias} {self.where_pk_sql()}")
+
+    def where_pk_sql(self) -> str:
+        """
+        Returns the WHERE clause matching the primary key without the table alias.
+        """
+        return self._cached_sql(
+            ("WHERE_PK",),
+            lambda: "WHERE " + " AND ".join([f"{col} = ?" for col in self.primaryKey])
+        )
+
+    def _cached_sql(self, key: tuple, build: Callable[[], str]) -> str:
+        """
+        The statements only depend on the static schema definition, so they are built once per schema instance.
+        """
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            sql = self._sql_cache[key] = build()
+        return sql
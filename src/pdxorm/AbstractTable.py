@@ -1,14 +1,21 @@
 import logging
+import threading
 from abc import ABC
-from typing import Any, Type
+from collections import defaultdict
+from functools import lru_cache
+from itertools import batched
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Sequence, Type
 
-from pdxorm.utils import get_elements_as_list
-from . import QueryGenerator
+from . import QueryGenerator, settings
 from .AbstractSchema import AbstractSchema
 from .BaseData import BaseData
 from .Connection import Connection
-from .ConnectionHandler import ConnectionHandler
 from .DBColumn import DBColumn
+from .DatabaseType import DatabaseType
+from .ConnectionHandler import ConnectionHandler
+from .IdentityMap import IdentityMap
+from .connections.AbstractConnection import AbstractConnection
 from .OrmEnums import FetchType
 from .QueryBuilder import QueryBuilder
 from .logger import ORM_LOGGER_NAME
@@ -17,6 +24,69 @@ from .result_objects.DBResult import DBResult
 
 orm_logger = logging.getLogger(ORM_LOGGER_NAME)
 
+# rows of tables with a cacheable schema, kept across calls: {table class: {primary key: data object}}
+_reference_cache: dict[type, dict[tuple, BaseData]] = {}
+_reference_cache_lock = threading.Lock()  # the cache is shared by all threads, its LRU updates are read-modify-write
+REFERENCE_CACHE_SIZE = 256  # max cached rows per table, the least recently used row is evicted first
+STREAM_BATCH_SIZE = 500  # rows fetched and resolved at once by get_data_with_query_iter
+
+
+@lru_cache(maxsize=None)
+def _columns_without(table: type["AbstractTable"], omitted: frozenset[str]) -> tuple[str, ...]:
+    """
+    Returns the schema columns of the table without the omitted ones.
+    The result only depends on the table class and the omitted columns, so it is cached.
+    """
+    return tuple(col for col in table.schema.columns if col not in omitted)
+
+
+def _key_getter(db_field_names: list[str]) -> Callable[[dict], tuple]:
+    """
+    Returns a function reading the given columns of a row as a tuple.
+    """
+    if len(db_field_names) == 1:
+        return lambda row, name=db_field_names[0]: (row[name],)
+    return itemgetter(*db_field_names)
+
+
+@lru_cache(maxsize=None)
+def _foreign_keys_by_reference(
+        dataclass: type[BaseData]
+) -> tuple[tuple[type, tuple[tuple[list[str], Callable[[dict], tuple]], ...]], ...]:
+    """
+    Groups the foreign keys of the dataclass by the table they reference.
+    Each foreign key is given by its db column names and a getter reading its key tuple from a row.
+    Only depends on the class metadata, so it is computed once per dataclass.
+    """
+    grouped: dict[type, list[tuple[list[str], Callable[[dict], tuple]]]] = {}
+    for values in dataclass.meta().foreign_keys.values():
+        db_field_names = [value.db_field_name for value in values]
+        grouped.setdefault(values[0].reference, []).append((db_field_names, _key_getter(db_field_names)))
+    return tuple((reference, tuple(foreign_keys)) for reference, foreign_keys in grouped.items())
+
+
+def _referenced_value_getter(value: DBColumn) -> Callable[[BaseData], Any]:
+    """
+    Returns a function reading the referenced column of a one-to-many relation from a referencing data object.
+    Plain columns are read with the cached attrgetter of the referencing class, so rows can be mapped in one call.
+    """
+    attr_names, getter, _ = value.reference.dataclass._get_column_plan((value.referenced_column,))
+    if getter is not None:
+        return getter
+    attr_name = attr_names[0]
+    return lambda row: row.get_db_value(attr_name)[0]
+
+
+@lru_cache(maxsize=None)
+def _comparison_columns(dataclass: type[BaseData]) -> tuple[str, ...]:
+    """
+    Returns the db columns needed to find the changed columns of an update: the primary key and all updatable columns.
+    """
+    meta = dataclass.meta()
+    columns = [field.db_field_name for field in meta.primary_keys]
+    columns.extend(db_field_name for _, db_field_names in meta.updatable_fields for db_field_name in db_field_names)
+    return tuple(dict.fromkeys(columns))
+
 
 class AbstractTable[D: BaseData, K](ABC):
     schema: AbstractSchema
@@ -27,18 +97,22 @@ class AbstractTable[D: BaseData, K](ABC):
         self._connection.connect()
 
     def get_all(self, fetch_type: FetchType = FetchType.EAGER) -> list[D]:
-        query = f"SELECT * FROM {self.schema.table_name};"
-
-        return self.get_data_with_query(query, fetch_type)
+        return self.get_data_with_query(self.schema.select_all_sql(), fetch_type)
 
     def get_one(self, key: K, nullable: bool = False, fetch_type: FetchType = FetchType.EAGER) -> D | None:
         """
         Returns a single row based on the provided key.
         """
-        if not isinstance(key, list) and not isinstance(key, tuple):
-            key = [key]
+        key = tuple(key) if isinstance(key, (list, tuple)) else (key,)
+        if fetch_type == FetchType.EAGER:
+            result = IdentityMap.get(type(self), key)
+            if result is not None:
+                return result
+
         query = QueryGenerator.generate_query_with_pk(self.schema, key)
         result = self.get_one_or_none_with_query(query, fetch_type)
+        if result is not None and fetch_type == FetchType.EAGER:
+            IdentityMap.add(type(self), result.pk, result)
         if not result and not nullable:
             raise ValueError(f"No data found for key: {key}")
         return result
@@ -51,20 +125,36 @@ class AbstractTable[D: BaseData, K](ABC):
 
     def _insert(self, data: D) -> None:
         column_names = self._columns_to_insert(data)
-        query = (
-            QueryBuilder()
-            .append("INSERT INTO " + self.schema.table_name_no_alias + " (" + ", ".join(column_names) + ") ")
-            .append("VALUES (" + ", ".join(["?"] * len(column_names)) + ")", data.get_values_for_columns(column_names))
-        )
+        query = QueryBuilder().append(self.schema.insert_sql(column_names), data.get_values_for_columns(column_names))
 
         self.execute(query)
 
+    def insert_many(self, data: list[D]) -> None:
+        """
+        Inserts multiple rows into the table within a single transaction.
+        """
+        self._insert_many(data)
+
+    def _insert_many(self, data: list[D]) -> None:
+        if not data:
+            return
+
+        # rows with unset auto generated fields need a different column list, so group them per statement
+        params_by_columns: dict[tuple[str, ...], list[list[Any]]] = {}
+        for item in data:
+            column_names = self._columns_to_insert(item)
+            params_by_columns.setdefault(column_names, []).append(item.get_values_for_columns(column_names))
+
+        self._invalidate_caches()
+        with Connection() as conn:
+            for column_names, params in params_by_columns.items():
+                conn.executemany(self.schema.insert_sql(column_names), params)
+
     def exists(self, key: K) -> bool:
         """
         Checks if a row with the given key exists in the table.
         """
-        if not isinstance(key, list) and not isinstance(key, tuple):
-            key = [key]
+        key = tuple(key) if isinstance(key, (list, tuple)) else (key,)
         query = QueryGenerator.generate_query_with_pk(self.schema, key)
         result = self.execute_select_query(query).to_item
         return result is not None
@@ -95,16 +185,15 @@ class AbstractTable[D: BaseData, K](ABC):
         return result
 
     @classmethod
-    def _columns_to_insert(cls, data: D) -> list[str]:
+    def _columns_to_insert(cls, data: D) -> tuple[str, ...]:
         """
         Returns the columns to be inserted into the table.
+        The tuple is shared between calls and must not be modified.
         """
-        auto_generated = data.meta().auto_generated_fields
-        columns_to_insert = []
-        for col in cls.schema.columns:
-            if col not in auto_generated or getattr(data, col) is not None:
-                columns_to_insert.append(col)
-        return columns_to_insert
+        auto_generated = data.meta().auto_generated_columns
+        omitted = frozenset(db_field_name for field_name, db_field_name in auto_generated
+                            if getattr(data, field_name) is None)
+        return _columns_without(cls, omitted)
 
     def update(self, data: D) -> None:
         """
@@ -113,66 +202,93 @@ class AbstractTable[D: BaseData, K](ABC):
         self._update(data)
 
     def _update(self, data: D) -> None:
-        existing_data = self.get_one(data.pk, fetch_type=FetchType.LAZY)
-        different_columns = list(self._get_different_columns(data, existing_data))
-        with Connection() as conn:
+        self._update_many([data])
+
+    def update_many(self, data: list[D]) -> None:
+        """
+        Updates multiple rows within a single transaction.
+        """
+        self._update_many(data)
+
+    def _update_many(self, data: list[D]) -> None:
+        if not data:
+            return
+
+        self._invalidate_caches()
+        existing_rows = self._get_existing_rows([item.pk for item in data])
+        changes = [(item, self._get_different_columns(item, existing_rows[item.pk])) for item in data]
+
+        # rows changing the same columns share one statement
+        params_by_columns: dict[tuple[str, ...], list[list[Any]]] = {}
+        for item, different_columns in changes:
             if different_columns:
-                schema = self.schema.without_alias()
-
-                attr = data.get_values_for_columns(different_columns)
-                main_query = (
-                    QueryBuilder()
-                    .append("UPDATE " + schema.table_name)
-                    .append("SET " + ", ".join([f"{col} = ?" for col in different_columns]), attr)
-                    .append(QueryGenerator.generate_where_with_pk(schema, data.pk))
-                )
-                conn.execute(main_query)
-
-            for col in data.meta().one_to_many_fields.values():
-                if col.db_field_name in different_columns:
-                    raise ValueError("Cannot update one-to-many fields directly. Update the related table instead.")
-
-                one_to_many_data: list[BaseData] = getattr(data, col.db_field_name)
-                if not isinstance(one_to_many_data, list) or len(one_to_many_data) == 0:
-                    continue
-
-                sc: AbstractSchema = col.reference.schema.without_alias()
-                columns_to_insert = col.reference._columns_to_insert(one_to_many_data[0])
-                columns_to_update = [col for col in sc.columns if col not in sc.primaryKey]
-                reference_query = (
-                    QueryBuilder()
-                    .append(
-                        "INSERT INTO " + sc.table_name_no_alias + " (" + ", ".join(columns_to_insert) + ") ")
-                    .append("VALUES (" + ", ".join(["?"] * len(columns_to_insert)) + ")")
-                    .append("ON CONFLICT (" + ", ".join(sc.primaryKey) + ") DO UPDATE")
-                    .append("SET " + ", ".join([f'{col} = ?' for col in columns_to_update]))
-                    .append(QueryGenerator.generate_where_with_pk(sc, tuple()))
-                )
-                params = []
-                for item in one_to_many_data:
-                    db_columns = item.get_values_for_columns(columns_to_insert)
-                    db_columns.extend(item.get_values_for_columns(columns_to_update))
-                    db_columns.extend(item.pk)
-                    params.append(db_columns)
-                conn.executemany(reference_query.query, params)
-                self.execute(
-                    QueryBuilder().append(f"DELETE FROM {sc.table_name} WHERE {col.referenced_column} = ? AND ",
-                                          data.get_db_value(col.field_name))
-                    .append(f"NOT ({', '.join(sc.primaryKey)})").appendIn([item.pk for item in one_to_many_data]), )
-
-    def _get_different_columns(self, data1: D, data2: D) -> set[str]:
-        fields = data1.meta().fields
-        different_columns = set()
-        for k, fields in fields.items():
-            for field in get_elements_as_list(fields, lambda f: f):
-                if field.db_field_name in get_elements_as_list(data1.meta().primary_keys, lambda f: f.db_field_name):
-                    continue
-                if field.auto_generated:
-                    continue
-                if data1.get_db_value(k) != data2.get_db_value(k):
-                    different_columns.add(field.db_field_name)
-
-        return different_columns
+                attr = item.get_values_for_columns(different_columns)
+                attr.extend(item.pk)
+                params_by_columns.setdefault(tuple(different_columns), []).append(attr)
+
+        with Connection() as conn:
+            for different_columns, params in params_by_columns.items():
+                if len(params) == 1:
+                    conn.execute(QueryBuilder().append(self.schema.update_sql(different_columns), params[0]))
+                else:
+                    conn.executemany(self.schema.update_sql(different_columns), params)
+
+            for item, different_columns in changes:
+                self._update_one_to_many(conn, item, different_columns)
+
+    def _get_existing_rows(self, keys: list[tuple]) -> dict[tuple, D]:
+        """
+        Loads the stored (lazy) rows for the given primary keys with a single query.
+        Only the columns compared by _get_different_columns are selected, so the rows are incomplete.
+        Raises ValueError if one of them does not exist.
+        """
+        query = self._select_by_primary_keys(self.schema, list(dict.fromkeys(keys)),
+                                             _comparison_columns(self.dataclass))
+        existing_rows = {row.pk: row for row in self.get_data_with_query(query, FetchType.LAZY)}
+        for key in keys:
+            if key not in existing_rows:
+                raise ValueError(f"No data found for key: {key}")
+        return existing_rows
+
+    def _update_one_to_many(self, conn: AbstractConnection, data: D, different_columns: list[str]) -> None:
+        """
+        Upserts the one-to-many children of the data and deletes the ones no longer referenced.
+        """
+        for col in data.meta().one_to_many_fields.values():
+            if col.db_field_name in different_columns:
+                raise ValueError("Cannot update one-to-many fields directly. Update the related table instead.")
+
+            one_to_many_data: list[BaseData] = getattr(data, col.db_field_name)
+            if not isinstance(one_to_many_data, list) or len(one_to_many_data) == 0:
+                continue
+
+            sc: AbstractSchema = col.reference.schema.without_alias()
+            columns_to_insert = col.reference._columns_to_insert(one_to_many_data[0])
+            reference_primary_key = frozenset(sc.primaryKey)
+            columns_to_update = [col for col in sc.columns if col not in reference_primary_key]
+            reference_query = sc.upsert_sql(columns_to_insert, columns_to_update)
+            params = []
+            for item in one_to_many_data:
+                db_columns = item.get_values_for_columns(columns_to_insert)
+                db_columns.extend(item.get_values_for_columns(columns_to_update))
+                db_columns.extend(item.pk)
+                params.append(db_columns)
+            conn.executemany(reference_query, params)
+            self.execute(
+                QueryBuilder().append(f"DELETE FROM {sc.table_name} WHERE {col.referenced_column} = ? AND ",
+                                      data.get_db_value(col.field_name))
+                .append(f"NOT ({', '.join(sc.primaryKey)})").appendIn([item.pk for item in one_to_many_data]), )
+
+    def _get_different_columns(self, data1: D, data2: D) -> list[str]:
+        """
+        Returns the changed db columns in field order, so equal changes produce the same (cached) UPDATE statement.
+        """
+        different_columns: dict[str, None] = {}
+        for field_name, db_field_names in data1.meta().updatable_fields:
+            if data1.get_db_value(field_name) != data2.get_db_value(field_name):
+                different_columns.update(dict.fromkeys(db_field_names))
+
+        return list(different_columns)
 
     def delete(self, data: D | K = None, key: K = None) -> None:
         """
@@ -186,14 +302,7 @@ class AbstractTable[D: BaseData, K](ABC):
         self._delete(pk)
 
     def _delete(self, primary_key: K) -> None:
-        schema = self.schema.without_alias()
-        query = (
-            QueryBuilder()
-            .append("DELETE FROM " + schema.table_name)
-            .append(QueryGenerator.generate_where_with_pk(schema, primary_key))
-        )
-
-        self.execute(query)
+        self.execute(QueryBuilder().append(self.schema.delete_sql(), primary_key))
 
     def get_data_with_query(self, query: QueryBuilder | str, fetch_type: FetchType = FetchType.EAGER) -> list[D]:
         """
@@ -202,71 +311,161 @@ class AbstractTable[D: BaseData, K](ABC):
         result = self.execute_select_query(query).to_dict
         return self._parse_db_result_to_dataclass(result, fetch_type)
 
-    def _parse_db_result_to_dataclass(self, result: list[dict], fetch_type: FetchType) -> list[D]:
-        foreign_key = self.dataclass.meta().foreign_keys.items()
+    def get_data_with_query_iter(
+            self, query: QueryBuilder | str, fetch_type: FetchType = FetchType.EAGER
+    ) -> Iterator[D]:
+        """
+        Yields the data objects of the provided query in batches instead of returning a list of all rows.
+        Relations are resolved per batch, which takes one query per referenced table and batch.
+        The statement stays open until the iterator is exhausted or closed. On SQLite without journal_mode=wal
+        it holds a read lock that long, so writes in the meantime (from this or another process) fail with
+        "database is locked". Close the iterator before writing or use WAL mode.
+        """
+        rows = self.execute_select_query(query).iter_dicts(STREAM_BATCH_SIZE)
+        try:
+            for batch in batched(rows, STREAM_BATCH_SIZE):
+                yield from self._parse_db_result_to_dataclass(list(batch), fetch_type)
+        finally:
+            rows.close()  # finishes the statement right away when the caller stops early
 
+    def _parse_db_result_to_dataclass(self, result: list[dict], fetch_type: FetchType) -> list[D]:
         if not result:
             return []
-        if fetch_type == FetchType.LAZY:
-            return [self.dataclass.from_db_dict(row) for row in result]
+        # tables without relations have nothing to resolve, even when loading eagerly
+        if fetch_type == FetchType.EAGER and self.dataclass.meta().reference_fields:
+            self._resolve_relations(result)
+        return self.dataclass.from_db_dicts(result)
+
+    def _resolve_relations(self, result: list[dict]) -> None:
+        """
+        Replaces the foreign keys and one-to-many fields in the given rows with the referenced data objects.
+        Every referenced table and every one-to-many relation is loaded with a single query for all rows,
+        afterwards all relations are patched in one pass over the rows.
+        """
+        # collect the keys of all relations before any row is patched
+        foreign_keys = []
+        for reference, references in _foreign_keys_by_reference(self.dataclass):
+            row_keys = [list(map(key_getter, result)) for _, key_getter in references]
+            lookup_map = self._load_foreign_keys(reference, row_keys)
+            # look up the referenced objects for all rows at once with the map's bound get
+            foreign_keys.extend(
+                (db_field_names, list(map(lookup_map.get, keys)))
+                for (db_field_names, _), keys in zip(references, row_keys)
+            )
 
-        for col, values in foreign_key:
-            foreign_key_values = {self._get_fk_as_tuple(row, values) for row in result}
-            foreign_key_values = list(filter(lambda row: all(item is not None for item in row), foreign_key_values))
-            if len(foreign_key_values) == 0:
+        # one-to-many relations into the same table share a single query
+        one_to_many_by_reference: dict[type[AbstractTable], list[tuple[DBColumn, list[Any]]]] = {}
+        for value in self.dataclass.meta().one_to_many_fields.values():
+            keys = [row[value.db_field_name] for row in result]
+            one_to_many_by_reference.setdefault(value.reference, []).append((value, keys))
+
+        one_to_many = []
+        for relations in one_to_many_by_reference.values():
+            for (value, keys), children_map in zip(relations, self._load_one_to_many(relations)):
+                get_children = children_map.get
+                one_to_many.append((value.db_field_name, [get_children(key) or [] for key in keys]))
+
+        for i, row in enumerate(result):
+            for db_field_names, resolved_values in foreign_keys:
+                resolved_value = resolved_values[i]
+                for db_field_name in db_field_names:
+                    row[db_field_name] = resolved_value
+            for db_field_name, children in one_to_many:
+                row[db_field_name] = children[i]
+
+    def _load_foreign_keys(self, reference: type["AbstractTable"], row_keys: list[list[tuple]]) -> dict[tuple, BaseData]:
+        """
+        Loads the referenced rows for the given foreign key values with a single query.
+        Returns a map from primary key to data object, NULL keys are skipped.
+        """
+        reference_cache = None
+        if reference.schema.cacheable:
+            with _reference_cache_lock:
+                reference_cache = _reference_cache.setdefault(reference, {})
+        lookup_map = {}
+        foreign_key_values = []
+        # dict.fromkeys keeps the first-seen order, so the generated IN list is stable
+        for key in dict.fromkeys(key for keys in row_keys for key in keys):
+            if None in key:
                 continue
+            cached = IdentityMap.get(reference, key)
+            if cached is None and reference_cache is not None:
+                with _reference_cache_lock:
+                    cached = reference_cache.pop(key, None)
+                    if cached is not None:
+                        # re-inserting moves the row to the end, so iteration order is least recently used first
+                        reference_cache[key] = cached
+            if cached is not None:
+                lookup_map[key] = cached
+            else:
+                foreign_key_values.append(key)
+
+        if len(foreign_key_values) > 0:
+            referenced_table = reference()
+            query = self._select_by_primary_keys(referenced_table.schema, foreign_key_values)
+            for i in referenced_table.get_data_with_query(query):
+                lookup_map[i.pk] = i
+                IdentityMap.add(reference, i.pk, i)
+                if reference_cache is not None:
+                    with _reference_cache_lock:
+                        if len(reference_cache) >= REFERENCE_CACHE_SIZE:
+                            del reference_cache[next(iter(reference_cache))]
+                        reference_cache[i.pk] = i
+        return lookup_map
 
-            referenced_schema = values[0].reference().schema
-            query = (
-                QueryBuilder()
-                .append(f"SELECT * FROM {referenced_schema.table_name} ")
-                .append(f"WHERE ({', '.join(referenced_schema.primaryKey)})")
-                .appendIn(list(foreign_key_values))
-            )
+    @staticmethod
+    def _load_one_to_many(relations: list[tuple[DBColumn, list[Any]]]) -> list[dict[Any, list[BaseData]]]:
+        """
+        Loads the rows referencing the given keys of one table with a single query.
+        Returns one map per relation from the referenced column value to the referencing rows.
+        """
+        query = QueryBuilder()
+        for i, (value, keys) in enumerate(relations):
+            query.appendIf(i > 0, "OR").append(value.referenced_column).appendIn(list(dict.fromkeys(keys)))
 
-            foreign_key_result = values[0].reference().get_data_with_query(query)
-            foreign_primary_key = referenced_schema.primaryKey
-            lookup_map = {}
-
-            if len(foreign_primary_key) > 1:
-                for i in foreign_key_result:
-                    lookup_map[i.pk] = i
-                for row in result:
-                    row_value = self._get_fk_as_tuple(row, values)
-
-                    if row_value in lookup_map:
-                        for val in values:
-                            row[val.db_field_name] = lookup_map[row_value]
-                    else:
-                        for val in values:
-                            row[val.db_field_name] = None
-            else:
-                foreign_key_map = {getattr(i, referenced_schema.primaryKey[0]): i for i in foreign_key_result}
-                self._update_result_dict(result, values[0].db_field_name, foreign_key_map)
-
-        one_to_many_cols = self.dataclass.meta().one_to_many_fields.items()
-
-        for col, value in one_to_many_cols:
-            db_values = {row[value.db_field_name] for row in result}
-            query = QueryBuilder().append(value.referenced_column).appendIn(list(db_values))
-            one_to_many_result = value.reference().get_data_with_where(query)
-            result_map = {}
-            for row in one_to_many_result:
-                row_value = getattr(row, value.referenced_column)
-                if row_value not in result_map:
-                    result_map[row_value] = []
+        rows = relations[0][0].reference().get_data_with_where(query)
+        result_maps = []
+        for value, _ in relations:
+            result_map = defaultdict(list)
+            for row_value, row in zip(map(_referenced_value_getter(value), rows), rows):
                 result_map[row_value].append(row)
-            self._update_result_dict(result, value.db_field_name, result_map, default=[])
+            result_maps.append(result_map)
+        return result_maps
 
-        return [self.dataclass.from_db_dict(row) for row in result]
-
-    def _update_result_dict(self, result: list[dict], column: str, result_map: dict, default: Any = None):
-        for row in result:
-            row_value = row[column]
-            if row_value in result_map:
-                row[column] = result_map[row_value]
-            else:
-                row[column] = default
+    @staticmethod
+    def _select_by_primary_keys(schema: AbstractSchema, keys: list[tuple],
+                                columns: Sequence[str] | None = None) -> QueryBuilder:
+        """
+        Builds a query selecting all rows of the schema whose primary key is one of the given keys.
+        Without columns the whole rows are selected.
+        A single key is selected with an equality condition on the primary key.
+        SQLite scans the whole table for a row value IN list, so composite keys are joined against
+        a VALUES table instead, which lets it probe the primary key index per key.
+        """
+        select = schema.select_sql(columns)
+        if len(keys) == 1:
+            # a single key (e.g. resolving one row) is a plain primary key lookup
+            if not columns:
+                return QueryGenerator.generate_query_with_pk(schema, keys[0])
+            return (
+                QueryBuilder()
+                .append(select)
+                .append(QueryGenerator.generate_where_with_pk(schema, keys[0]))
+            )
+        primary_key = ", ".join(schema.primaryKey)
+        if len(schema.primaryKey) > 1 and settings.DB_TYPE == DatabaseType.SQLITE:
+            placeholders = (("(" + ("?, " * len(schema.primaryKey))[:-2] + "), ") * len(keys))[:-2]
+            return (
+                QueryBuilder()
+                .append(f"WITH _keys({primary_key}) AS (VALUES {placeholders})", [v for key in keys for v in key])
+                .append(f"{select} JOIN _keys USING ({primary_key})")
+            )
+        return (
+            QueryBuilder()
+            .append(select)
+            .where(f"({primary_key})")
+            .appendIn(keys)
+        )
 
     def get_one_with_query(
             self, query: QueryBuilder | str, nullable: bool = False, fetch_type: FetchType = FetchType.EAGER
@@ -285,33 +484,19 @@ class AbstractTable[D: BaseData, K](ABC):
         """
         Returns a single row based on the provided query.
         """
-        result = self.execute_select_query(query).to_dict
-        if not result:
+        result_as_dict = self.execute_select_query(query).to_first_dict
+        if result_as_dict is None:
             return None
-        result_as_dict = result[0]
-        if fetch_type == FetchType.EAGER:
-            for col, values in self.dataclass.meta().foreign_keys.items():
-                key = self._get_fk_as_tuple(result_as_dict, values)
-                resolved_value = values[0].reference().get_one(key, nullable=True)
-                self._set_values(result_as_dict, values, resolved_value)
-
-            for col, values in self.dataclass.meta().one_to_many_fields.items():
-                key = result_as_dict[values.db_field_name]
-                query = QueryBuilder().append(f"{values.referenced_column} = ?;", (key,))
-                resolved_value = values.reference().get_data_with_where(query)
-                result_as_dict[values.db_field_name] = resolved_value or []
+        if fetch_type == FetchType.EAGER and self.dataclass.meta().reference_fields:
+            self._resolve_relations([result_as_dict])
 
         return self.dataclass.from_db_dict(result_as_dict)
 
-    def _set_values(self, db_dict: dict, columns: list[DBColumn], data: Any):
-        for col in columns:
-            db_dict[col.db_field_name] = data
-
     def get_data_with_where(self, query: QueryBuilder | str, fetch_type: FetchType = FetchType.EAGER) -> list[D]:
         """
         Returns a list of data objects based on the provided query where clause.
         """
-        query = QueryBuilder().append(f"SELECT * FROM {self.schema.table_name_no_alias} WHERE").append(query)
+        query = QueryBuilder().append(self.schema.select_where_sql()).append(query)
         return self.get_data_with_query(query, fetch_type)
 
     def get_one_with_where(
@@ -320,7 +505,7 @@ class AbstractTable[D: BaseData, K](ABC):
         """
         Returns a single row based on the provided query where clause.
         """
-        query = QueryBuilder().append(f"SELECT * FROM {self.schema.table_name_no_alias} WHERE").append(query)
+        query = QueryBuilder().append(self.schema.select_where_sql()).append(query)
         return self.get_one_with_query(query, nullable, fetch_type)
 
     def get_one_with_join(
@@ -354,22 +539,25 @@ class AbstractTable[D: BaseData, K](ABC):
         )
         return self.get_data_with_query(whole_query, fetch_type)
 
-    @staticmethod
-    def _get_fk_as_tuple(result: dict, fk: list[DBColumn]) -> tuple:
-        key = []
-        for value in fk:
-            key.append(result[value.db_field_name])
-        return tuple(key)
-
     def execute_select_query(self, query: QueryBuilder | str, params: list | tuple | None = None) -> DBResult:
         """
         Executes a SELECT query and returns the result.
         """
         return self._connection.execute(query, params)
 
+    def _invalidate_caches(self) -> None:
+        """
+        Drops cached rows before a write: the whole identity map and all cached rows.
+        Cached rows of other tables embed resolved rows of this one, so no table is kept.
+        """
+        IdentityMap.clear()
+        with _reference_cache_lock:
+            _reference_cache.clear()
+
     def execute(self, query: QueryBuilder | str, params: list | tuple | None = None):
         """
         Executes a query (INSERT, UPDATE, DELETE) and returns the result.
         """
+        self._invalidate_caches()
         with Connection() as db:
             db.execute(query, params)
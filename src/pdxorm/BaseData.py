@@ -1,16 +1,15 @@
 import json
 import typing
-from typing import Any, dataclass_transform
+from operator import attrgetter
+from typing import Any, Callable, dataclass_transform
 
 from .DBColumn import DBColumn
-from .ModelMeta import MetaInformation, ModelMeta
-from .utils import get_as_tuple, get_elements_as_list, get_first_or_element
+from .LazyField import LazyField
+from .ModelMeta import MetaInformation, ModelMeta, build_db_values_getter
+from .utils import get_as_tuple, is_type_or_list_type
 
-
-class LazyField:
-    def __init__(self, db_values: list[Any], reference: Any):
-        self.db_values = db_values
-        self.reference = reference
+# values of these types are returned as they are by as_dict, checked before the isinstance chain
+_PLAIN_TYPES = frozenset({int, float, str, bool, bytes, type(None)})
 
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(DBColumn,))
@@ -20,26 +19,29 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         self._data = kwargs.get("date_from_db_raw", None)  # Raw-Data from db if given
         self._loaded_from_db = False  # Flag, ob das Objekt aus der DB kommt
 
-        for field_name, field_obj in self._meta.fields.items():
-            field_obj = get_first_or_element(field_obj)
+        # lokale Bindungen für die Schleife über alle Felder
+        instance_dict = self.__dict__
+        kwargs_get = kwargs.get
+        is_resolved = self._is_type_or_list_type
+        for field_name, default_value, reference in self._meta.init_fields:
             # Setze Standardwerte oder übergebene Werte
-            if isinstance(field_obj, list):
-                default_value = None
-            else:
-                default_value = field_obj.default_value
-            value = kwargs.get(field_name, default_value)
-            if isinstance(value, dict):
-                # Wenn der Wert ein Dictionary ist, konvertiere ihn in das richtige Format
-                value = field_obj.reference.dataclass(**value)
-            if isinstance(value, list):
+            value = kwargs_get(field_name, default_value)
+            if value is None:
+                pass
+            elif reference is None:
+                if isinstance(value, list):
+                    value = list(value)  # keine geteilte Liste, z.B. bei einem Standardwert
+            elif isinstance(value, dict):
+                # Wenn der Wert ein Dictionary ist, konvertiere ihn in das richtige Format (danach ist er geladen)
+                value = reference.dataclass(**value)
+            elif isinstance(value, list):
                 # Wenn der Wert eine Liste ist, konvertiere ihn in die richtige Form
-                value = [field_obj.reference.dataclass(**item) if isinstance(item, dict) else item for item in value]
-
-            if value is not None and not isinstance(value,
-                                                    LazyField) and field_obj.reference and not self._is_type_or_list_type(
-                value, BaseData):
-                value = LazyField(value, field_obj.reference)
-            setattr(self, field_name, value)
+                value = [reference.dataclass(**item) if isinstance(item, dict) else item for item in value]
+                if not is_resolved(value, BaseData):
+                    value = LazyField(value, reference)
+            elif type(value) is not LazyField and not isinstance(value, BaseData):
+                value = LazyField(value, reference)
+            instance_dict[field_name] = value
 
         # self.validate_types()
 
@@ -48,7 +50,7 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         return f"{self.__class__.__name__}(Pk[{field_values}])"
 
     def __str__(self):
-        pks = get_elements_as_list(self._meta.primary_keys, lambda x: x.field_name)
+        pks = self._meta.primary_key_names
         pk_values = ', '.join(f"{k.field_name}={getattr(self, k.field_name)}" for k in self._meta.primary_keys)
 
         field_values = ', '.join(
@@ -57,22 +59,20 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         return f"{self.__class__.__name__}(Pk[{pk_values}], {field_values})"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
         if self.pk != other.pk:
             return False
-        for field_name in self._meta.fields.keys():
+        getter = self._meta.plain_fields_getter
+        if getter is not None and getter(self.__dict__) != getter(other.__dict__):
+            return False
+        for field_name in self._meta.reference_fields:
             if self.get_db_value(field_name) != other.get_db_value(field_name):
                 return False
         return True
 
-    def __getattribute__(self, name: str) -> Any:
-        value = object.__getattribute__(self, name)
-        if isinstance(value, LazyField):
-            # calculate LAZY fetch
-            raise AttributeError("This field is not loaded yet. Please load it from the database first.")
-        return value
-
     def __hash__(self):
         return hash((self.__class__, self.pk))
 
@@ -82,60 +82,67 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         Converts a dictionary from the database to an instance of the class.
         No dict nesting allowed only other instances of BaseData
         """
-        new_dict = {}
-        for field_name, field_obj in cls.meta().fields.items():
-            if isinstance(field_obj, list):
-                value = db_dict.get(field_obj[0].db_field_name, None)
-                reference = field_obj[0].reference
-            else:
-                value = db_dict.get(field_obj.db_field_name, None)
-                reference = field_obj.reference
-
-            if reference and value is not None and not cls._is_type_or_list_type(value, reference.dataclass):
-                collect_lazy_values = []
-                for field in get_elements_as_list(field_obj):
-                    collect_lazy_values.append(db_dict.get(field.db_field_name, None))
-                new_dict[field_name] = LazyField(collect_lazy_values, reference)
-            else:
-                new_dict[field_name] = value
-        return cls(**new_dict, date_from_db_raw=db_dict)
+        return cls.from_db_dicts([db_dict])[0]
+
+    @classmethod
+    def from_db_dicts(cls, db_dicts: list[dict]) -> list["BaseData"]:
+        """
+        Converts multiple dictionaries from the database to instances of the class.
+        The instances are created without running __init__ by a converter generated once per class (see ModelMeta).
+        """
+        return cls._meta.row_converter(cls, db_dicts)
 
     @staticmethod
     def _is_type_or_list_type(value: Any, expected_type: Any) -> bool:
         """
         Check if the value is of the expected type or a list of the expected type.
         """
-        if isinstance(value, list):
-            return all(isinstance(item, expected_type) for item in value)
-        return isinstance(value, expected_type)
+        return is_type_or_list_type(value, expected_type)
 
     def validate_types(self):
         """
         Validates the types of the attributes of the object. (AI)
         """
-        for name, expected_type in self.__annotations__.items():
-            origin = typing.get_origin(expected_type)
-            args = typing.get_args(expected_type)
-            value = self.__dict__[name]
-            if isinstance(value, LazyField):
-                continue
-            if value is None:
+        instance_dict = self.__dict__
+        for name, expected_type, kind, check in self._get_validate_plan():
+            value = instance_dict[name]
+            if value is None or type(value) is LazyField:
                 continue
 
-            if origin is typing.Union and type(None) in args:  # Optional types
-                non_none_args = tuple(arg for arg in args if arg is not type(None))
-                isvalid = isinstance(value, non_none_args) or value is None
-            elif origin is typing.Literal:  # Literal types
-                isvalid = value in args
-            elif origin:  # Other generic types
-                isvalid = isinstance(value, origin)
-            else:  # Simple types
-                isvalid_boolean_int = expected_type is bool and isinstance(value, int) and value in (0, 1)
-                isvalid = isinstance(value, expected_type) or isvalid_boolean_int
+            if kind == "literal":  # Literal types
+                isvalid = value in check
+            elif kind == "simple":  # Simple types
+                isvalid_boolean_int = check is bool and isinstance(value, int) and value in (0, 1)
+                isvalid = isinstance(value, check) or isvalid_boolean_int
+            else:  # Optional and other generic types
+                isvalid = isinstance(value, check)
 
             if not isvalid:
                 raise TypeError(f"Type of {name} is not {expected_type}, but {type(value)}: {value}")
 
+    @classmethod
+    def _get_validate_plan(cls) -> tuple[tuple[str, Any, str, Any], ...]:
+        """
+        Returns (name, expected_type, kind, check) per annotated field. The type hints are only inspected
+        with typing.get_origin/get_args once per class, the plan is cached in the meta information.
+        """
+        plan = cls._meta.validate_plan
+        if plan is None:
+            entries = []
+            for name, expected_type in cls.__annotations__.items():
+                origin = typing.get_origin(expected_type)
+                args = typing.get_args(expected_type)
+                if origin is typing.Union and type(None) in args:  # Optional types
+                    entries.append((name, expected_type, "types", tuple(arg for arg in args if arg is not type(None))))
+                elif origin is typing.Literal:  # Literal types
+                    entries.append((name, expected_type, "literal", args))
+                elif origin:  # Other generic types
+                    entries.append((name, expected_type, "types", origin))
+                else:  # Simple types
+                    entries.append((name, expected_type, "simple", expected_type))
+            plan = cls._meta.validate_plan = tuple(entries)
+        return plan
+
     @property
     def primary_key(self) -> tuple:
         """
@@ -148,8 +155,11 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         """
         Returns the primary key of the object as a database representation.
         """
-        key = []
+        getter = self._meta.primary_key_getter
+        if getter is not None:
+            return getter(self.__dict__)
 
+        key = []
         for field in self._meta.primary_keys:
             key.extend(self.get_db_value(field.field_name))
         return tuple(key)
@@ -181,8 +191,8 @@ class BaseData[K: tuple](metaclass=ModelMeta):
             raise ValueError(f"Column {attribute} not found in meta information")
         value = self.__dict__[attribute]
         if value is None:
-            return (None,) * len(get_as_tuple(self._meta.fields[attribute]))
-        if isinstance(value, LazyField):
+            return self._meta.null_db_values[attribute]
+        if type(value) is LazyField:
             return get_as_tuple(value.db_values)
         if isinstance(value, BaseData):
             return value.pk
@@ -200,7 +210,7 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         """
         if attribute not in self._meta.fields:
             raise ValueError(f"Column {attribute} not found in meta information")
-        if isinstance(value, LazyField):
+        if type(value) is LazyField:
             value = value.db_values
         if isinstance(value, BaseData) or self._meta.db_columns[attribute].reference:
             value = LazyField(value, self._meta.db_columns[attribute].reference)
@@ -212,18 +222,32 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         Args:
             columns: A list of database column names to get values for.
         """
-        values: list[Any] = []
-        already_seen: set[Any] = set()
-        for col in columns:
-            if col not in self._meta.db_columns:
-                raise ValueError(f"Column {col} not found in meta information")
-            attr_name = self.meta().db_columns[col].field_name
-            if attr_name in already_seen:
-                continue
-            already_seen.add(attr_name)
-            values.extend(self.get_db_value(attr_name))
+        return self._get_column_plan(tuple(columns))[2](self)
 
-        return values
+    @classmethod
+    def _get_column_plan(
+            cls, columns: tuple[str, ...]
+    ) -> tuple[tuple[str, ...], Callable | None, Callable[["BaseData"], list]]:
+        """
+        Returns the deduplicated attribute names for the given database columns, an attrgetter fetching all values
+        in one call if none of the columns references another table, and a generated function returning the db values
+        of an instance as a list. Plans are cached per class.
+        """
+        plan = cls._meta.column_plans.get(columns)
+        if plan is None:
+            attr_fields: dict[str, type | None] = {}  # {model_attr: reference} in column order
+            for col in columns:
+                if col not in cls._meta.db_columns:
+                    raise ValueError(f"Column {col} not found in meta information")
+                field = cls._meta.db_columns[col]
+                attr_fields.setdefault(field.field_name, field.reference)
+
+            attr_names = tuple(attr_fields)
+            plain_columns = all(reference is None for reference in attr_fields.values())
+            getter = attrgetter(*attr_names) if attr_names and plain_columns else None
+            db_values_getter = build_db_values_getter(tuple(attr_fields.items()))
+            plan = cls._meta.column_plans[columns] = (attr_names, getter, db_values_getter)
+        return plan
 
     def as_json(self, indent: int = 2, default: Any = str) -> str:
         """
@@ -235,17 +259,30 @@ class BaseData[K: tuple](metaclass=ModelMeta):
         """
         Returns a JSON representation of the object as a dictionary.
         """
-        return {k: self._dict_or_elem(getattr(self, k)) for k in self._meta.fields.keys()}
+        values = self.__dict__
+        result = {}
+        for field_name, is_reference in self._meta.dict_fields:
+            # references are read through their descriptor, which raises while they are not loaded
+            value = getattr(self, field_name) if is_reference else values[field_name]
+            result[field_name] = value if type(value) in _PLAIN_TYPES else self._dict_or_elem(value)
+        return result
 
-    def _dict_or_elem(self, obj: Any):  # noqa: ANN202
-        if isinstance(obj, list):
-            return [self._dict_or_elem(x) for x in obj]
-        elif isinstance(obj, BaseData):
-            return obj.as_dict()
-        elif isinstance(obj, dict):
-            return {k: self._dict_or_elem(v) for k, v in obj.items()}
-        else:
+    @staticmethod
+    def _dict_or_elem(obj: Any):  # noqa: ANN205
+        obj_type = type(obj)
+        if obj_type in _PLAIN_TYPES:
             return obj
+        if obj_type is list:
+            convert = BaseData._dict_or_elem
+            return [x if type(x) in _PLAIN_TYPES else convert(x) for x in obj]
+        if isinstance(obj, BaseData):
+            return obj.as_dict()
+        # dicts and subclasses of list are rare in field values, they take the isinstance path
+        if isinstance(obj, list):
+            return [BaseData._dict_or_elem(x) for x in obj]
+        if isinstance(obj, dict):
+            return {k: BaseData._dict_or_elem(v) for k, v in obj.items()}
+        return obj
 
     def copy(self) -> typing.Self:
         """
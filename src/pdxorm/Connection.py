@@ -1,6 +1,5 @@
 import contextvars
 import logging
-import traceback
 from types import TracebackType
 
 from pdxorm.connections.AbstractConnection import AbstractConnection
@@ -26,6 +25,12 @@ class Connection:
             _transaction_depth_var.set(current_depth + 1)
         else:
             self.conn = ConnectionHandler.get_writable_connection(self.foreign_keys)
+            if self.conn.in_transaction:
+                # left over by a transaction that could not be finished, BEGIN would fail inside it
+                orm_logger.warning("Connection is still in a transaction, rolling it back")
+                self._rollback()
+                self.conn = ConnectionHandler.get_writable_connection(self.foreign_keys)
+            self.conn.begin()
             _current_connection_var.set(self.conn)  # noqa
             _transaction_depth_var.set(1)
         return self.conn
@@ -42,15 +47,29 @@ class Connection:
         if new_depth == 0:
             try:
                 if exc_type:
-                    orm_logger.warning(f"Error: {exc_val}")
-                    tb_str = ''.join(traceback.format_tb(exc_tb))
-                    orm_logger.error(f"Traceback:\n{tb_str}")
-                    orm_logger.warning("Rolling back changes")
-                    self.conn.rollback()
+                    orm_logger.error("Transaction failed, rolling back changes",
+                                     exc_info=(exc_type, exc_val, exc_tb))
+                    self._rollback()
                 else:
-                    self.conn.commit()
+                    try:
+                        self.conn.commit()
+                    except Exception:
+                        # e.g. "database is locked", the pooled connection must not stay inside the transaction
+                        orm_logger.error("Commit failed, rolling back changes", exc_info=True)
+                        self._rollback()
+                        raise
             finally:
+                # the connection itself stays open and is reused by the next transaction
                 _current_connection_var.set(None)
                 _transaction_depth_var.set(0)
-                self.conn.close()
                 self.conn = None
+
+    def _rollback(self) -> None:
+        """
+        Rolls back the transaction. A connection that cannot be rolled back is dropped from the pool and closed.
+        """
+        try:
+            self.conn.rollback()
+        except Exception as e:
+            orm_logger.error("Rollback failed, discarding the connection: %s", e)
+            ConnectionHandler.discard_writable_connection(self.conn)
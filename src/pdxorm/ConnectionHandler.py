@@ -1,56 +1,102 @@
+import atexit
 import logging
+import threading
+import weakref
 
 from . import settings
 from .DatabaseType import DatabaseType
 from .connections.AbstractConnection import AbstractConnection
-from .connections.MySqlConnection import MySqlConnection
-from .connections.SqliteConnection import SqliteConnection
 from .logger import ORM_LOGGER_NAME
 
 orm_logger = logging.getLogger(ORM_LOGGER_NAME)
 
 
 class ConnectionHandler:
-    _open_connections: list[AbstractConnection] = []
+    # weak, so connections of finished threads are released with their thread-local slot instead of piling up
+    _open_connections: "weakref.WeakSet[AbstractConnection]" = weakref.WeakSet()
     _read_connection: AbstractConnection | None = None
+    _writable_connections = threading.local()  # per thread: {foreign_keys: AbstractConnection}
 
     @staticmethod
     def get_readonly_connection() -> AbstractConnection:
         if not settings.DB_IS_INITIALIZED:
             raise RuntimeError("Database is not initialized.")
 
-        if ConnectionHandler._read_connection is not None:
-            return ConnectionHandler._read_connection
+        read_connection = ConnectionHandler._read_connection
+        if read_connection is None or not read_connection.open:
+            ConnectionHandler._read_connection = ConnectionHandler._create_connection(readonly=True)
+        return ConnectionHandler._read_connection
 
+    @staticmethod
+    def _create_connection(readonly: bool, foreign_keys: bool = True) -> AbstractConnection:
+        """
+        Opens a new connection for the configured database type and registers it for close_all_connections.
+        """
+        # only the configured backend (and its driver) is imported
         match settings.DB_TYPE:
             case DatabaseType.SQLITE:
-                connection = SqliteConnection(readonly=True)
-                ConnectionHandler._read_connection = connection
-                ConnectionHandler._open_connections.append(connection)
-                return connection
+                from .connections.SqliteConnection import SqliteConnection
+                connection = SqliteConnection(readonly=readonly, foreign_keys=foreign_keys)
             case DatabaseType.MYSQL:
-                connection = MySqlConnection(readonly=True)
-                ConnectionHandler._read_connection = connection
-                ConnectionHandler._open_connections.append(connection)
-                return connection
+                from .connections.MySqlConnection import MySqlConnection
+                connection = MySqlConnection(readonly=readonly)
             case _:
                 raise ValueError("Unsupported database type.")
+        ConnectionHandler._open_connections.add(connection)
+        return connection
 
     @staticmethod
     def get_writable_connection(foreign_keys: bool) -> AbstractConnection:
+        """
+        Returns the writable connection of the current thread.
+        The connection stays open after a transaction and is reused by the next one.
+        """
         if not settings.DB_IS_INITIALIZED:
             raise RuntimeError("Database is not initialized.")
 
-        match settings.DB_TYPE:
-            case DatabaseType.SQLITE:
-                return SqliteConnection(readonly=False, foreign_keys=foreign_keys)
-            case DatabaseType.MYSQL:
-                return MySqlConnection(readonly=False)
-            case _:
-                raise ValueError("Unsupported database type.")
+        connections: dict[bool, AbstractConnection] | None = getattr(
+            ConnectionHandler._writable_connections, "connections", None)
+        if connections is None:
+            connections = ConnectionHandler._writable_connections.connections = {}
+
+        connection = connections.get(foreign_keys)
+        if connection is not None and connection.open:
+            match settings.DB_TYPE:
+                case DatabaseType.MYSQL:
+                    # the server drops idle connections, so check before reusing it
+                    if connection.ping():
+                        return connection
+                    connection.close()
+                    ConnectionHandler._open_connections.discard(connection)
+                case _:
+                    return connection
+
+        connection = ConnectionHandler._create_connection(readonly=False, foreign_keys=foreign_keys)
+        connections[foreign_keys] = connection
+        return connection
+
+    @staticmethod
+    def discard_writable_connection(connection: AbstractConnection) -> None:
+        """
+        Removes a broken writable connection from the pool of the current thread and closes it,
+        so the next transaction opens a new one.
+        """
+        connections: dict[bool, AbstractConnection] = getattr(
+            ConnectionHandler._writable_connections, "connections", {})
+        for foreign_keys, pooled in list(connections.items()):
+            if pooled is connection:
+                del connections[foreign_keys]
+        ConnectionHandler._open_connections.discard(connection)
+        try:
+            connection.close()
+        except Exception as e:
+            orm_logger.warning("Error while closing a discarded connection: %s", e)
 
     @staticmethod
     def close_all_connections():
-        for conn in ConnectionHandler._open_connections:
+        for conn in list(ConnectionHandler._open_connections):
             conn.close()
         ConnectionHandler._open_connections.clear()
+
+
+atexit.register(ConnectionHandler.close_all_connections)
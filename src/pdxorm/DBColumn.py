@@ -18,6 +18,9 @@ class DBColumn:
         referenced_column (str | None): The name of the column in the referenced table that this field references.
     """
 
+    __slots__ = ("field_name", "db_field_name", "nullable", "reference", "primary_key", "default_value",
+                 "auto_generated", "referenced_column", "model_attribute")
+
     def __init__(self, field_name: str, db_field_name: str, nullable: bool, reference: Type["AbstractTable"] | None,
                  primary_key: bool = False, default_value: Any = None, auto_generated: bool = False,
                  referenced_column: str = None):
@@ -29,8 +32,9 @@ class DBColumn:
         self.default_value = default_value
         self.auto_generated = auto_generated
         self.referenced_column = referenced_column
+        self.model_attribute: str | None = None  # set by ModelMeta to the attribute the column is assigned to
 
     def __repr__(self) -> str:
         return f"DBColumn(field_name={self.field_name}, db_field_name={self.db_field_name}, nullable={self.nullable}, " \
-               f"reference={self.reference}, primary_key={self.primary_key}, default_value={self.default_value}) " \
+               f"reference={self.reference}, primary_key={self.primary_key}, default_value={self.default_value}, " \
                f"auto_generated={self.auto_generated}, referenced_column={self.referenced_column})"
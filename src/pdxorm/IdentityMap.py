@@ -0,0 +1,57 @@
+import contextvars
+from types import TracebackType
+from typing import Any
+
+_identity_map_var = contextvars.ContextVar("identity_map", default=None)
+
+
+class IdentityMap:
+    """
+    Caches eagerly loaded rows by table and primary key while the context is active.
+    Repeated lookups of the same row (e.g. the same foreign key on many rows) are served without a query.
+
+    Every write through an AbstractTable clears the whole map, because cached rows may embed the changed one.
+    Nested contexts share the map of the outermost one.
+    """
+
+    def __init__(self):
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> "IdentityMap":
+        if _identity_map_var.get() is None:
+            self._token = _identity_map_var.set({})
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None,
+                 exc_tb: TracebackType | None):
+        if self._token is not None:
+            _identity_map_var.reset(self._token)
+            self._token = None
+
+    @staticmethod
+    def get(table: type, key: tuple) -> Any | None:
+        """
+        Returns the cached row of the table with the given primary key or None.
+        """
+        identity_map = _identity_map_var.get()
+        if identity_map is None:
+            return None
+        return identity_map.get((table, key))
+
+    @staticmethod
+    def add(table: type, key: tuple, data: Any) -> None:
+        """
+        Caches the row if an identity map is active.
+        """
+        identity_map = _identity_map_var.get()
+        if identity_map is not None:
+            identity_map[(table, key)] = data
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all cached rows of the active identity map.
+        """
+        identity_map = _identity_map_var.get()
+        if identity_map is not None:
+            identity_map.clear()
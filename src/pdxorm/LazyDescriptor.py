@@ -0,0 +1,37 @@
+from typing import Any
+
+from .LazyField import LazyField
+
+
+class LazyDescriptor:
+    """
+    Data descriptor for fields referencing another table, the only fields that can hold a LazyField.
+    The value lives in the instance dict, reading it raises an AttributeError while the reference is not loaded.
+    Fields without a reference have no descriptor and are read from the instance dict directly.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if type(value) is LazyField:
+            # calculate LAZY fetch
+            raise AttributeError("This field is not loaded yet. Please load it from the database first.")
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance: Any) -> None:
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
@@ -0,0 +1,13 @@
+from typing import Any
+
+
+class LazyField:
+    """
+    Placeholder for a reference that is not loaded yet. It is checked with type() is, so it must not be subclassed.
+    """
+
+    __slots__ = ("db_values", "reference")
+
+    def __init__(self, db_values: list[Any], reference: Any):
+        self.db_values = db_values
+        self.reference = reference
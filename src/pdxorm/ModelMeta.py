@@ -1,17 +1,100 @@
-from dataclasses import dataclass
-from typing import dataclass_transform
+import sys
+from dataclasses import dataclass, field as dataclass_field
+from operator import itemgetter
+from typing import Any, Callable, dataclass_transform
 
 from pdxorm.DBColumn import DBColumn
+from pdxorm.LazyDescriptor import LazyDescriptor
+from pdxorm.LazyField import LazyField
+from pdxorm.utils import compile_function, get_elements_as_list, is_type_or_list_type
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaInformation:
     fields: dict[str, DBColumn | list[DBColumn]]  # Dict from {model_attr: Field_instance}
     db_columns: dict[str, DBColumn]  # Map from {db_column_name: Field_instance}
     primary_keys: list[DBColumn]  # List of primary key fields
+    primary_key_names: frozenset[str]  # field names of the primary key fields
+    primary_key_getter: Callable | None  # returns the pk tuple from the instance dict if no pk field is a reference
     foreign_keys: dict[str, list[DBColumn]]  # Map from {model_attr: [Field_instance]}
     one_to_many_fields: dict[str, DBColumn]  # Map from {model_attr: Field_instance}
     auto_generated_fields: list[DBColumn]  # List of auto generated fields
+    auto_generated_columns: tuple[tuple[str, str], ...]  # ((model_attr, db_column_name), ...) of auto generated fields
+    updatable_fields: tuple[tuple[str, tuple[str, ...]], ...]  # ((model_attr, (db_column_name, ...)), ...)
+    # ((model_attr, first_db_column_name, reference, (db_column_name, ...)), ...) used to build rows from the db
+    row_fields: tuple[tuple[str, str, type | None, tuple[str, ...]], ...]
+    init_fields: tuple[tuple[str, Any, type | None], ...]  # ((model_attr, default_value, reference), ...) for __init__
+    plain_fields_getter: Callable | None  # itemgetter over the instance dict for all fields without a reference
+    reference_fields: tuple[str, ...]  # model_attrs of fields referencing another table
+    dict_fields: tuple[tuple[str, bool], ...]  # ((model_attr, references another table), ...) in field order for as_dict
+    null_db_values: dict[str, tuple[None, ...]]  # {model_attr: (None, ...)} with one None per db column of the field
+    # generated function (cls, db_dicts) -> instances, specialized to row_fields, set by ModelMeta
+    row_converter: Callable[[type, list[dict]], list] | None = None
+    # (model_attr, type hint, kind, check) per annotated field, filled by BaseData.validate_types on first use
+    validate_plan: tuple[tuple[str, Any, str, Any], ...] | None = None
+    # Cache from {(db_column_name, ...): ((model_attr, ...), attrgetter | None, db values getter)}, filled by BaseData
+    column_plans: dict[tuple[str, ...], tuple[tuple[str, ...], Callable | None, Callable[[Any], list]]] = \
+        dataclass_field(default_factory=dict)
+
+
+def _build_row_converter(meta: MetaInformation) -> Callable[[type, list[dict]], list]:
+    """
+    Generates the function converting database rows to instances of a class with the given meta information.
+    Every column access and reference check is written out, so a row costs no loop over the fields.
+    The reference dataclasses are only read inside the function, because tables may set them after the class.
+    """
+    namespace: dict[str, Any] = {
+        "new": object.__new__,
+        "LazyField": LazyField,
+        "is_resolved": is_type_or_list_type,
+        "meta": meta,
+    }
+    lines = [
+        "def from_db_dicts(cls, db_dicts):",
+        "    result = []",
+        "    append = result.append",
+        "    for db_dict in db_dicts:",
+        "        get = db_dict.get",
+    ]
+    items = []
+    for i, (key, db_field_name, reference, db_field_names) in enumerate(meta.row_fields):
+        if reference is None:
+            items.append(f"{key!r}: get({db_field_name!r})")
+            continue
+        namespace[f"reference_{i}"] = reference
+        db_values = ", ".join(f"get({name!r})" for name in db_field_names)
+        lines.extend([
+            f"        value_{i} = get({db_field_name!r})",
+            f"        if value_{i} is not None and not is_resolved(value_{i}, reference_{i}.dataclass):",
+            f"            value_{i} = LazyField([{db_values}], reference_{i})",
+            # rows with the same one-to-many key get the same children list, every instance needs its own copy
+            f"        elif type(value_{i}) is list:",
+            f"            value_{i} = list(value_{i})",
+        ])
+        items.append(f"{key!r}: value_{i}")
+    items.extend(["'_meta': meta", "'_data': db_dict", "'_loaded_from_db': False"])
+    lines.extend([
+        "        obj = new(cls)",
+        f"        obj.__dict__.update({{{', '.join(items)}}})",
+        "        append(obj)",
+        "    return result",
+    ])
+    return compile_function("from_db_dicts", lines, namespace)
+
+
+def build_db_values_getter(fields: tuple[tuple[str, type | None], ...]) -> Callable[[Any], list]:
+    """
+    Generates the function returning the db values of the given (model_attr, reference) fields of an instance
+    as a new list, in one expression instead of a loop over the fields.
+    """
+    values = ", ".join(f"*self.get_db_value({name!r})" if reference else f"values[{name!r}]"
+                       for name, reference in fields)
+    lines = [
+        "def db_values(self):",
+        "    values = self.__dict__",
+        f"    return [{values}]",
+    ]
+    return compile_function("db_values", lines)
 
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(DBColumn,))
@@ -29,18 +112,22 @@ class ModelMeta(type):
         one_to_many_field: dict[str, DBColumn] = {}
         auto_generated_field: list[DBColumn] = []
 
-        # delete the passed class attributes values
-        for key, value in list(cls_dict.items()):
-            if isinstance(value, DBColumn):
+        # collect the passed class attributes values, the fields are deleted from the class dict afterwards
+        field_keys = []
+        for key, value in cls_dict.items():
+            if type(value) is DBColumn or isinstance(value, DBColumn):
                 value.model_attribute = key  # tell the field which attribute it belongs to
                 if value.field_name is None:  # default db name
                     value.field_name = key
+                # the names are dict keys of every row and instance, interned ones compare by identity
+                value.field_name = sys.intern(value.field_name)
+                value.db_field_name = sys.intern(value.db_field_name)
                 fields[key] = value  # save the field in the dict
                 db_columns[value.db_field_name] = value  # save the field in the db_columns dict
                 if value.primary_key:
                     primary_key_field.append(value)
                 if value.auto_generated:
-                    auto_generated_field.append(value.field_name)
+                    auto_generated_field.append(value)
 
                 if value.reference:
                     if value.referenced_column:
@@ -48,16 +135,22 @@ class ModelMeta(type):
                     else:
                         foreign_key_field[key] = [value]
 
-                del cls_dict[key]
-            elif isinstance(value, list):
-                # check if the list contains DBColumn instances
-                if all(isinstance(item, DBColumn) for item in value):
-                    for item in value:
-                        db_columns[item.db_field_name] = item
-                        if item.primary_key:
-                            primary_key_field.append(item)
-                    foreign_key_field[key] = value
-                    fields[key] = value
+                field_keys.append(key)
+            elif isinstance(value, list) and value and isinstance(value[0], DBColumn):
+                # composite fields are lists of DBColumn instances only, the first one identifies them
+                if __debug__ and not all(isinstance(item, DBColumn) for item in value):
+                    raise ValueError(f"Field {key} mixes DBColumn instances with other values")
+                for item in value:
+                    if item.field_name is not None:
+                        item.field_name = sys.intern(item.field_name)
+                    item.db_field_name = sys.intern(item.db_field_name)
+                    db_columns[item.db_field_name] = item
+                    if item.primary_key:
+                        primary_key_field.append(item)
+                foreign_key_field[key] = value
+                fields[key] = value
+        for key in field_keys:
+            del cls_dict[key]
 
         # save the collected data in the meta dict
         meta = {
@@ -72,16 +165,66 @@ class ModelMeta(type):
         if "__orig_bases__" in cls_dict and cls_dict["__orig_bases__"] and cls_dict["__orig_bases__"][
             0].__name__ != "BaseData" and \
                 cls_dict["__orig_bases__"][0].__name__ != "Generic":
-            meta["fields"].update(cls_dict["__orig_bases__"][0].meta().fields)
-            meta["db_columns"].update(cls_dict["__orig_bases__"][0].meta().db_columns)
-            meta["primary_keys"].extend(cls_dict["__orig_bases__"][0].meta().primary_keys)
-            meta["foreign_keys"].update(cls_dict["__orig_bases__"][0].meta().foreign_keys)
-            meta["one_to_many_fields"].update(cls_dict["__orig_bases__"][0].meta().one_to_many_fields)
-            meta["auto_generated_fields"].extend(cls_dict["__orig_bases__"][0].meta().auto_generated_fields)
+            base_meta = cls_dict["__orig_bases__"][0].meta()
+            meta["fields"].update(base_meta.fields)
+            meta["db_columns"].update(base_meta.db_columns)
+            meta["primary_keys"].extend(base_meta.primary_keys)
+            meta["foreign_keys"].update(base_meta.foreign_keys)
+            meta["one_to_many_fields"].update(base_meta.one_to_many_fields)
+            meta["auto_generated_fields"].extend(base_meta.auto_generated_fields)
+
+        meta["auto_generated_columns"] = tuple(
+            (field.field_name, field.db_field_name)
+            for value in meta["fields"].values() for field in get_elements_as_list(value) if field.auto_generated
+        )
+        meta["primary_key_names"] = frozenset(field.field_name for field in meta["primary_keys"])
+
+        # plain primary keys are read straight from the instance dict, references need get_db_value
+        primary_key_getter = None
+        primary_key_names = tuple(field.field_name for field in meta["primary_keys"])
+        if primary_key_names and all(field.reference is None for field in meta["primary_keys"]):
+            if len(primary_key_names) == 1:
+                primary_key_getter = lambda values, name=primary_key_names[0]: (values[name],)  # noqa: E731
+            else:
+                primary_key_getter = itemgetter(*primary_key_names)
+        meta["primary_key_getter"] = primary_key_getter
+
+        # precompute the columns an UPDATE may touch (everything except primary keys and auto generated fields)
+        primary_key_columns = {field.db_field_name for field in meta["primary_keys"]}
+        updatable_fields = []
+        for key, value in meta["fields"].items():
+            db_field_names = tuple(field.db_field_name for field in get_elements_as_list(value)
+                                   if field.db_field_name not in primary_key_columns and not field.auto_generated)
+            if db_field_names:
+                updatable_fields.append((key, db_field_names))
+        meta["updatable_fields"] = tuple(updatable_fields)
+
+        # precompute how each field is read from a database row and initialized in __init__
+        row_fields = []
+        init_fields = []
+        for key, value in meta["fields"].items():
+            columns = get_elements_as_list(value)
+            row_fields.append((key, columns[0].db_field_name, columns[0].reference,
+                               tuple(field.db_field_name for field in columns)))
+            init_fields.append((key, columns[0].default_value, columns[0].reference))
+        meta["row_fields"] = tuple(row_fields)
+        meta["init_fields"] = tuple(init_fields)
+
+        # split the fields for __eq__: plain values can be compared directly, references by their db value
+        plain_fields = tuple(key for key, _, reference, _ in row_fields if reference is None)
+        meta["plain_fields_getter"] = itemgetter(*plain_fields) if plain_fields else None
+        meta["reference_fields"] = tuple(key for key, _, reference, _ in row_fields if reference is not None)
+        meta["dict_fields"] = tuple((key, reference is not None) for key, _, reference, _ in row_fields)
+        meta["null_db_values"] = {key: (None,) * len(db_field_names) for key, _, _, db_field_names in row_fields}
 
         meta = MetaInformation(**meta)
+        meta.row_converter = _build_row_converter(meta)
         cls_dict['_meta'] = meta  # save the meta dict in the class dict
 
+        # only references can hold a LazyField, so only their reads go through a descriptor
+        for key in meta.reference_fields:
+            cls_dict[key] = LazyDescriptor(key)
+
         # create the new class
         new_class = super().__new__(mcs, name, bases, cls_dict)
 
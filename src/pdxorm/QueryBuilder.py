@@ -1,17 +1,22 @@
+from itertools import chain
 from typing import Any, Callable, Self
 
 
 class QueryBuilder:
+    __slots__ = ("_query", "_params", "_joined_query", "_pyformat_query", "_has_where")
+
     def __init__(self):
         self._query = []
         self._params = []
+        self._joined_query: str | None = None  # cache of the joined fragments, reset whenever a fragment is added
+        self._pyformat_query: str | None = None  # cache of the joined fragments with %s placeholders
 
-        self._has_from = False
         self._has_where = False
 
     def append(self, query: str | Self, params: list | Any = None) -> Self:
         """
         Appends a query to the current query.
+        A WHERE inside the text is not tracked, conditions for appendWhereOrAnd are started with where().
         """
         if isinstance(query, QueryBuilder):
             return self._append_self(query)
@@ -23,13 +28,8 @@ class QueryBuilder:
 
         self._query.append(query)
         self._params.extend(params)
-
-        if "FROM" in query:
-            self._has_from = True
-
-        if "WHERE" in query:
-            self._has_where = True
-
+        self._joined_query = None
+        self._pyformat_query = None
         return self
 
     def appendIf(self, condition: bool, query: str | Self, params: list | Any | Callable[[], Any] = None) -> Self:
@@ -43,17 +43,21 @@ class QueryBuilder:
             return self.append(query, params)
         return self
 
+    def where(self, query: str, params: list | Any = None) -> Self:
+        """
+        Appends a WHERE clause to the current query, later conditions of appendWhereOrAnd are joined with AND.
+        """
+        self.append("WHERE " + query, params)
+        self._has_where = True
+        return self
+
     def appendWhereOrAnd(self, query: str, params: list | Any = None) -> Self:
         """
         Appends a WHERE or AND clause to the current query.
         """
         if not self._has_where:
-            query = "WHERE " + query
-            self._has_where = True
-        else:
-            query = "AND " + query
-
-        return self.append(query, params)
+            return self.where(query, params)
+        return self.append("AND " + query, params)
 
     def appendIn(self, values: list[Any]) -> Self:
         """
@@ -62,10 +66,11 @@ class QueryBuilder:
         if not values:
             raise ValueError("IN clause cannot be empty")
         if isinstance(values[0], tuple) or isinstance(values[0], list):
-            placeholders = ", ".join(["(" + ", ".join(["?"] * len(v)) + ")" for v in values])
-            params = self._flatten(values)
+            # all row values have the same length, so the group is built once
+            placeholders = (("(" + ("?, " * len(values[0]))[:-2] + "), ") * len(values))[:-2]
+            params = list(chain.from_iterable(values))
         else:
-            placeholders = ", ".join(["?"] * len(values))
+            placeholders = ("?, " * len(values))[:-2]
             params = values
 
         query = f"IN ({placeholders})"
@@ -78,19 +83,25 @@ class QueryBuilder:
         if not isinstance(query, QueryBuilder):
             raise TypeError("Expected a QueryBuilder instance")
 
-        self._query.append(f"(")
-        self.append(query)
+        # a WHERE inside the parentheses belongs to the subquery, so the flag is not taken over
+        self._query.append("(")
+        self._query.extend(query._query)
+        self._params.extend(query._params)
         self._query.append(")")
+        self._joined_query = None
+        self._pyformat_query = None
         return self
 
     def __str__(self) -> str:
         """
         Returns the current query as a string.
         """
-        query = " ".join(self._query)
-        for param in self._params:
-            query = query.replace("?", str(param), 1)
-        return query
+        parts = self.query.split("?")
+        result = [parts[0]]
+        for i, part in enumerate(parts[1:]):
+            result.append(str(self._params[i]) if i < len(self._params) else "?")
+            result.append(part)
+        return "".join(result)
 
     def __repr__(self) -> str:
         """
@@ -115,22 +126,28 @@ class QueryBuilder:
         """
         self._query.extend(query._query)
         self._params.extend(query._params)
+        self._joined_query = None
+        self._pyformat_query = None
+        self._has_where = self._has_where or query._has_where
         return self
 
-    def _flatten(self, lst: list) -> list:
+    @property
+    def query(self) -> str:
         """
-        Flattens a list of lists into a single list.
-        :param lst: The list to flatten.
-        :return: A flattened list.
+        Returns the current query as a string.
         """
-        return [item for sublist in lst for item in sublist]
+        if self._joined_query is None:
+            self._joined_query = " ".join(self._query)
+        return self._joined_query
 
     @property
-    def query(self) -> str:
+    def query_pyformat(self) -> str:
         """
-        Returns the current query as a string.
+        Returns the current query with %s placeholders instead of ? for drivers using the pyformat style.
         """
-        return " ".join(self._query)
+        if self._pyformat_query is None:
+            self._pyformat_query = self.query.replace("?", "%s")
+        return self._pyformat_query
 
     @property
     def params(self) -> list[Any]:
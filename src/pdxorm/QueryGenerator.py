@@ -1,29 +1,59 @@
+from functools import lru_cache
 from typing import Any
 
 from .AbstractSchema import AbstractSchema
 from .QueryBuilder import QueryBuilder
 
 
-def generate_where_with_pk(schema: AbstractSchema, pk: tuple[Any]) -> QueryBuilder:
+@lru_cache(maxsize=None)
+def generate_pk_condition_template(schema: AbstractSchema) -> str:
     """
-    Generates a WHERE clause based on the primary key of the schema.
+    Returns the parameterized condition matching the primary key of the schema.
+    It only depends on the schema, so it is built once per schema instance.
     """
-
-    query = QueryBuilder()
     alias = ""
     if schema.alias:
         alias = schema.alias + "."
 
-    query.append("WHERE " + " AND ".join([f"{alias}{col} = ?" for col in schema.primaryKey]), pk)
-    return query
+    return " AND ".join([f"{alias}{col} = ?" for col in schema.primaryKey])
+
+
+@lru_cache(maxsize=None)
+def generate_where_with_pk_template(schema: AbstractSchema) -> str:
+    """
+    Returns the parameterized WHERE clause matching the primary key of the schema.
+    """
+    return "WHERE " + generate_pk_condition_template(schema)
+
+
+@lru_cache(maxsize=None)
+def generate_query_with_pk_template(schema: AbstractSchema) -> str:
+    """
+    Returns the parameterized SELECT statement for a single primary key of the schema.
+    """
+    return f"{schema.select} FROM {schema.table_name} {generate_where_with_pk_template(schema)}"
+
+
+def generate_where_with_pk(schema: AbstractSchema, pk: tuple[Any]) -> QueryBuilder:
+    """
+    Generates a WHERE clause based on the primary key of the schema.
+    """
+    return QueryBuilder().where(generate_pk_condition_template(schema), pk)
 
 
 def generate_query_with_pk(schema: AbstractSchema, key: tuple) -> QueryBuilder:
-    return (
-        QueryBuilder()
-        .append(f"{schema.select} FROM " + schema.table_name)
-        .append(generate_where_with_pk(schema, key))
-    )
+    return QueryBuilder().append(generate_query_with_pk_template(schema), key)
+
+
+@lru_cache(maxsize=1024)
+def _join_sql(table_schema: AbstractSchema, join_columns: tuple[str, ...], join_schema: AbstractSchema,
+              join_type: str) -> str:
+    """
+    Returns the JOIN clause, it only depends on its arguments, so it is built once per combination.
+    """
+    return f"{join_type} JOIN {join_schema.table_name} ON " + " AND ".join(
+        [f"{table_schema.alias}.{col2} = {join_schema.alias}.{col}" for col, col2 in
+         zip(join_schema.primaryKey, join_columns)])
 
 
 def generate_join(
@@ -35,10 +65,4 @@ def generate_join(
     """
     Generates a JOIN clause for the given schema and join schema.
     """
-    query = QueryBuilder()
-    query.append(
-        f"{join_type} JOIN {join_schema.table_name} ON " + " AND ".join(
-            [f"{table_schema.alias}.{col2} = {join_schema.alias}.{col}" for col, col2 in
-             zip(join_schema.primaryKey, join_columns)])
-    )
-    return query
+    return QueryBuilder().append(_join_sql(table_schema, tuple(join_columns), join_schema, join_type))
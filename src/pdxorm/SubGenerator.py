@@ -1,5 +1,7 @@
 import argparse
 import ast
+import hashlib
+import math
 import sys
 from pathlib import Path
 from typing import List, Optional, Set
@@ -13,6 +15,10 @@ Disclaimer: THIS FILE IS AI GENERATED.
 # Du kannst dies anpassen, falls sie anders heißt.
 BASE_CLASS_NAME = "BaseData"
 
+# Erhöhen, wenn sich die erzeugten Stubs ändern, damit bestehende Stubs neu erzeugt werden
+STUB_GENERATOR_VERSION = 2
+SOURCE_HASH_PREFIX = "# source-sha256: "
+
 
 class InfoFieldDetails:
     """Hilfsklasse zum Speichern extrahierter Infos aus InfoField."""
@@ -23,6 +29,20 @@ class InfoFieldDetails:
         # Du könntest hier weitere Infos speichern, falls nötig
 
 
+def unparse(node: ast.AST) -> str:
+    """ast.unparse mit Abkürzung für einfache Namen und Konstanten, die den Großteil der Annotationen ausmachen."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Constant):
+        value = node.value
+        # repr entspricht hier ast.unparse, nur unendliche floats schreibt ast.unparse als 1e309
+        if type(value) in (int, bool, str, bytes, type(None)) or (type(value) is float and math.isfinite(value)):
+            return repr(value)
+    elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return f"{node.value.id}.{node.attr}"
+    return ast.unparse(node).strip()
+
+
 def get_infofield_details(node: ast.Call) -> InfoFieldDetails:
     """Extrahiert Details aus dem ast.Call-Knoten von InfoField."""
     details = InfoFieldDetails()
@@ -40,7 +60,7 @@ def get_infofield_details(node: ast.Call) -> InfoFieldDetails:
         if kw.arg == 'default_value':
             # Wir brauchen die String-Repräsentation des Werts
             try:
-                details.default_value_repr = ast.unparse(kw.value).strip()
+                details.default_value_repr = unparse(kw.value)
             except AttributeError:  # Fallback für sehr alte ast-Versionen
                 # Dies ist sehr vereinfacht und nicht robust für komplexe Defaults
                 if isinstance(kw.value, ast.Constant):
@@ -49,17 +69,22 @@ def get_infofield_details(node: ast.Call) -> InfoFieldDetails:
     return details
 
 
+OPTIONAL_IMPORT = "from typing import Optional"
+OPTIONAL_PREFIXES = ("Optional[", "None |", "None|")
+OPTIONAL_SUFFIXES = ("| None", "|None")
+
+
 def is_optional_type(type_str: str) -> bool:
     """Prüft, ob ein Typ-String 'Optional' oder '| None' enthält."""
-    return type_str.startswith("Optional[") or \
-        type_str.endswith("| None") or \
-        type_str.strip() == "None"
+    type_str = type_str.strip()
+    return type_str == "None" or type_str.startswith(OPTIONAL_PREFIXES) or type_str.endswith(OPTIONAL_SUFFIXES)
 
 
-class StubVisitor(ast.NodeVisitor):
+class StubVisitor:
     """
     Besucht AST-Knoten, um Klassendefinitionen zu finden
     und Stub-Informationen zu sammeln.
+    Es werden nur Anweisungen durchlaufen, da Importe, Funktionen und Klassen nie in Ausdrücken stehen.
     """
 
     def __init__(self, base_class_name: str):
@@ -68,15 +93,41 @@ class StubVisitor(ast.NodeVisitor):
         self.functions_defs: List[str] = []
         self.imports: Set[str] = set()  # Standard-Imports
 
+    def run(self, tree: ast.Module):
+        """Sammelt die Stub-Informationen eines Moduls."""
+        self._visit_statements(tree.body)
+
+    def _visit_statements(self, statements: List[ast.stmt]):
+        """Ruft die passende visit_-Methode auf und steigt sonst nur in verschachtelte Anweisungsblöcke ab."""
+        for node in statements:
+            if isinstance(node, ast.ClassDef):
+                self.visit_ClassDef(node)
+            elif isinstance(node, ast.FunctionDef):
+                self.visit_FunctionDef(node)
+            elif isinstance(node, ast.Import):
+                self.visit_Import(node)
+            elif isinstance(node, ast.ImportFrom):
+                self.visit_ImportFrom(node)
+            else:
+                # z.B. if TYPE_CHECKING:, try/except, with - nur die Blöcke, keine Ausdrücke
+                for _, value in ast.iter_fields(node):
+                    if not isinstance(value, list):
+                        continue
+                    for item in value:
+                        if isinstance(item, ast.stmt):
+                            self._visit_statements([item])
+                        elif isinstance(item, (ast.excepthandler, ast.match_case)):
+                            self._visit_statements(item.body)
+
     def _format_type_hint(self, node: Optional[ast.expr]) -> str:
         """Formatiert einen Typ-Hint-AST-Knoten als String."""
         if node is None:
             return "Any"  # Fallback, sollte nicht passieren bei AnnAssign
         try:
-            type_str = ast.unparse(node).strip()
+            type_str = unparse(node)
             # Sammle potenzielle Imports (vereinfacht)
-            if "Optional[" in type_str or "| None" in type_str:
-                self.imports.add("from typing import Optional")
+            if "Optional[" in type_str:  # "X | None" braucht keinen Import
+                self.imports.add(OPTIONAL_IMPORT)
             # Man könnte hier weiter gehen und alle Namen sammeln und
             # prüfen, ob sie Builtins sind oder importiert werden müssen.
             return type_str
@@ -130,7 +181,7 @@ class StubVisitor(ast.NodeVisitor):
                 inherits_from_base = True
 
         if not inherits_from_base:
-            self.generic_visit(node)  # Besuche Kinder, falls es verschachtelte Klassen gibt
+            self._visit_statements(node.body)  # Besuche Kinder, falls es verschachtelte Klassen gibt
             return  # Überspringe Klassen, die nicht erben
 
         class_name = node.name
@@ -175,32 +226,55 @@ class StubVisitor(ast.NodeVisitor):
                 fields.append(f"    {field_name} = '{value}'")
 
         # Stub-Teil für diese Klasse zusammenbauen
-        class_stub = f"\n\nclass {class_name}{base_str}:\n"
+        class_stub = [f"\n\nclass {class_name}{base_str}:\n"]
         if fields:
-            class_stub += "\n".join(fields) + "\n"
+            class_stub.append("\n".join(fields) + "\n")
         else:
-            class_stub += "    pass\n"  # Falls keine Felder gefunden wurden
+            class_stub.append("    pass\n")  # Falls keine Felder gefunden wurden
 
         # __init__ hinzufügen
+        class_stub.append("\n")
         if init_params:
-            init_sig = "    def __init__(\n        self,\n        *,\n"  # Erzwingt Keyword-Argumente
-            init_sig += ",\n".join([f"        {p}" for p in init_params])
-            init_sig += "\n    ) -> None: ..."
+            class_stub.append("    def __init__(\n        self,\n        *,\n")  # Erzwingt Keyword-Argumente
+            class_stub.append(",\n".join([f"        {p}" for p in init_params]))
+            class_stub.append("\n    ) -> None: ...")
         else:
-            init_sig = "    def __init__(self) -> None: ..."  # Einfacher Init wenn keine Felder
+            class_stub.append("    def __init__(self) -> None: ...")  # Einfacher Init wenn keine Felder
+        class_stub.append("\n")
 
-        class_stub += "\n" + init_sig + "\n"
-
-        self.stub_parts.append(class_stub)
+        self.stub_parts.append("".join(class_stub))
         # Besuche keine Kinder von passenden Klassen mehr, da wir alles verarbeitet haben
-        self.generic_visit(node)  # Auskommentiert
+        self._visit_statements(node.body)
+
+
+def get_source_hash(source_code: str, base_class_name: str) -> str:
+    """Hash über Quelltext und alles, was die erzeugte Stub-Datei sonst noch beeinflusst."""
+    key = f"{STUB_GENERATOR_VERSION}\0{sys.version_info[:2]}\0{base_class_name}\0{source_code}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def is_stub_up_to_date(target_file: Path, source_hash: str) -> bool:
+    """Prüft, ob die Stub-Datei aus genau diesem Quelltext erzeugt wurde."""
+    try:
+        with target_file.open(encoding='utf-8') as f:
+            for _ in range(3):  # der Hash steht im Header
+                if f.readline().rstrip("\n") == SOURCE_HASH_PREFIX + source_hash:
+                    return True
+    except OSError:
+        pass
+    return False
 
 
-def generate_stub_file(source_file: Path, target_file: Path, base_class_name: str):
+def generate_stub_file(source_file: Path, target_file: Path, base_class_name: str, force: bool = False):
     """Liest eine Python-Datei, parst sie und schreibt die Stub-Datei."""
     print(f"Processing {source_file}...")
     try:
         source_code = source_file.read_text(encoding='utf-8')
+        source_hash = get_source_hash(source_code, base_class_name)
+        # Unveränderte Dateien müssen weder geparst noch neu geschrieben werden
+        if not force and is_stub_up_to_date(target_file, source_hash):
+            print(f"Stub file is up to date: {target_file}")
+            return
         tree = ast.parse(source_code)
     except FileNotFoundError:
         print(f"Error: Source file not found: {source_file}", file=sys.stderr)
@@ -213,7 +287,7 @@ def generate_stub_file(source_file: Path, target_file: Path, base_class_name: st
         sys.exit(1)
 
     visitor = StubVisitor(base_class_name)
-    visitor.visit(tree)
+    visitor.run(tree)
 
     if not visitor.stub_parts:
         print(f"Warning: No classes inheriting from '{base_class_name}' found in {source_file}.")
@@ -221,13 +295,18 @@ def generate_stub_file(source_file: Path, target_file: Path, base_class_name: st
         # return
 
     # Header und Imports hinzufügen
-    output_content = "# pylint: skip-file\n"  # Hinweis für Pylint
-    output_content += "# -*- coding: utf-8 -*-\n"
-    output_content += "\"\"\"Auto-generated stub file for {} - DO NOT EDIT\"\"\"\n\n".format(source_file.name)
-    output_content += "\n".join(sorted(list(visitor.imports)))
-    output_content += "".join(visitor.stub_parts)
-    output_content += "\n" + "\n\n".join(visitor.functions_defs)
-    output_content += "\n"
+    output_parts = [
+        "# pylint: skip-file\n",  # Hinweis für Pylint
+        "# -*- coding: utf-8 -*-\n",
+        SOURCE_HASH_PREFIX + source_hash + "\n",
+        "\"\"\"Auto-generated stub file for {} - DO NOT EDIT\"\"\"\n\n".format(source_file.name),
+        "\n".join(sorted(visitor.imports)),
+        *visitor.stub_parts,
+        "\n",
+        "\n\n".join(visitor.functions_defs),
+        "\n",
+    ]
+    output_content = "".join(output_parts)
 
     try:
         target_file.parent.mkdir(parents=True, exist_ok=True)
@@ -249,6 +328,8 @@ if __name__ == "__main__":
                         help="Path to the output stub file (.pyi). Defaults to the same directory and name as the source file with a .pyi extension.")
     parser.add_argument("-b", "--base-class", type=str, default=BASE_CLASS_NAME,
                         help=f"Name of the base class to look for (default: {BASE_CLASS_NAME}).")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="Regenerate stub files even if their source has not changed.")
 
     args = parser.parse_args()
     input_path: Path = Path(args.source_file)
@@ -269,4 +350,4 @@ if __name__ == "__main__":
             print(f"Error: Source and target file cannot be the same: {source_file}", file=sys.stderr)
             sys.exit(1)
 
-        generate_stub_file(source_file, output_path, args.base_class)
+        generate_stub_file(source_file, output_path, args.base_class, args.force)
@@ -21,6 +21,18 @@ class AbstractConnection(ABC):
     def close(self):
         ...
 
+    def begin(self):
+        """
+        Starts a transaction. By default the driver opens one implicitly with the first statement.
+        """
+
+    @property
+    def in_transaction(self) -> bool:
+        """
+        Whether a transaction is still open on the connection. Drivers that cannot tell report False.
+        """
+        return False
+
     @abstractmethod
     def rollback(self):
         ...
@@ -45,17 +57,30 @@ class AbstractConnection(ABC):
     def ping(self) -> bool:
         ...
 
-    def log(self, msg: str):
-        is_pragma = msg.lower().strip().startswith("pragma") and "key" not in msg.lower()
-        is_select = msg.lower().strip().startswith("select")
-
+    def log(self, msg: str | QueryBuilder):
+        """
+        Logs a statement. A QueryBuilder is only rendered with its parameters if the record is actually emitted.
+        """
+        if not self._log_enabled():
+            return
         if not self._readonly:
+            statement = self._get_query(msg).lower().strip()
+            is_pragma = statement.startswith("pragma") and "key" not in statement
+            is_select = statement.startswith("select")
+
             if is_pragma or is_select:
                 orm_logger.debug("DML-CONNECTION: %s", msg)  # PRAGMA statements are not logged as DML
             else:
                 orm_logger.info("DML-CONNECTION: %s", msg)
         else:
-            orm_logger.debug(msg)
+            orm_logger.debug("%s", msg)
+
+    def _log_enabled(self) -> bool:
+        """
+        Whether log would emit anything, so callers can skip building expensive messages.
+        Readonly connections only log on DEBUG, writable ones at least on INFO.
+        """
+        return orm_logger.isEnabledFor(logging.DEBUG if self._readonly else logging.INFO)
 
     def _get_query(self, query: str | QueryBuilder):
         if isinstance(query, QueryBuilder):
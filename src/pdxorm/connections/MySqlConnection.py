@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 # Import MySQLdb only if available
 try:
@@ -15,6 +16,14 @@ from ..result_objects.MySqlDBResult import MySqlDBResult
 orm_logger = logging.getLogger(ORM_LOGGER_NAME)
 
 
+@lru_cache(maxsize=1024)
+def _replace_placeholder(query: str) -> str:
+    """
+    Plain string statements are mostly the same few cached statements of the schemas, so the conversion is cached.
+    """
+    return query.replace("?", "%s")
+
+
 class MySqlConnection(AbstractConnection):
     def __init__(self, readonly: bool):
         if MySQLdb is None:
@@ -60,14 +69,22 @@ class MySqlConnection(AbstractConnection):
 
     def execute(self, query: QueryBuilder | str, params: list | tuple | None = None) -> DBResult:
         assert self._cursor is not None
-        self.log(
-            self._cursor.mogrify(self.replace_placeholder(self._get_query(query)), self._get_params(query, params)))
-        self._cursor.execute(self.replace_placeholder(self._get_query(query)), self._get_params(query, params))
+        statement = self._get_pyformat_query(query)
+        params = self._get_params(query, params)
+        if self._log_enabled():
+            # mogrify renders the whole statement, so it is only called if the record is emitted
+            self.log(self._cursor.mogrify(statement, params))
+        self._cursor.execute(statement, params)
 
         return MySqlDBResult(self._cursor)
 
     def executemany(self, query: QueryBuilder | str, params: list[tuple] | list[list] | None = None) -> DBResult:
-        raise NotImplementedError("MySQL does not support executemany in this ORM implementation.")
+        assert self._cursor is not None
+        statement = self._get_pyformat_query(query)
+        self.log(statement[:20] + "... (many)")
+        self._cursor.executemany(statement, params or [])
+
+        return MySqlDBResult(self._cursor)
 
     def executescript(self, script: str) -> DBResult:
         raise NotImplementedError("MySQL does not support executescript in this ORM implementation.")
@@ -81,4 +98,9 @@ class MySqlConnection(AbstractConnection):
             return False
 
     def replace_placeholder(self, query: str) -> str:
-        return query.replace("?", "%s")
+        return _replace_placeholder(query)
+
+    def _get_pyformat_query(self, query: str | QueryBuilder) -> str:
+        if isinstance(query, QueryBuilder):
+            return query.query_pyformat
+        return _replace_placeholder(query)
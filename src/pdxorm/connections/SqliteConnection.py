@@ -14,6 +14,10 @@ from ..result_objects.SqliteDBResult import SqliteDBResult
 
 orm_logger = logging.getLogger(ORM_LOGGER_NAME)
 
+# prepared statements kept per connection, the default of 128 is easily exceeded by the
+# per column set INSERT/UPDATE statements and the per key count IN lists
+STATEMENT_CACHE_SIZE = 1024
+
 
 class SqliteConnection(AbstractConnection):
 
@@ -32,13 +36,27 @@ class SqliteConnection(AbstractConnection):
         # Try connecting to database
         try:
             path = settings.DB_PATH if not self._readonly else "file:" + settings.DB_PATH + "?mode=ro"
+            # writable connections manage their transactions themselves (see begin)
             self._con = sqlite3.connect(path,
                                         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
                                         check_same_thread=False,
-                                        uri=True)
+                                        uri=True,
+                                        cached_statements=STATEMENT_CACHE_SIZE,
+                                        isolation_level="DEFERRED" if self._readonly else None)
             if not self._readonly:
                 self._con.execute(f"PRAGMA foreign_keys = {self.foreign_keys}")
-                self._con.execute("BEGIN TRANSACTION")
+                # the writable connections are long-lived, so the pragmas are only set once per connection
+                if settings.DB_JOURNAL_MODE is not None:
+                    self._con.execute(f"PRAGMA journal_mode = {settings.DB_JOURNAL_MODE}")
+                if settings.DB_SYNCHRONOUS is not None:
+                    self._con.execute(f"PRAGMA synchronous = {settings.DB_SYNCHRONOUS}")
+            # read tuning, useful for the long-lived read connection as well
+            if settings.DB_TEMP_STORE is not None:
+                self._con.execute(f"PRAGMA temp_store = {settings.DB_TEMP_STORE}")
+            if settings.DB_CACHE_SIZE is not None:
+                self._con.execute(f"PRAGMA cache_size = {settings.DB_CACHE_SIZE:d}")
+            if settings.DB_MMAP_SIZE is not None:
+                self._con.execute(f"PRAGMA mmap_size = {settings.DB_MMAP_SIZE:d}")
 
             self.cursor = self._con.cursor()
         except sqlite3.Error as e:
@@ -59,22 +77,28 @@ class SqliteConnection(AbstractConnection):
 
     def execute(self, query: QueryBuilder | str, params: list | tuple | None = None) -> DBResult:
         if isinstance(query, QueryBuilder) or params is None:
-            self.log(str(query))
-        else:
+            self.log(query)
+        elif self._log_enabled():
             self.log(str(query) + " | " + str(params))
         return SqliteDBResult(self._con.execute(self._get_query(query), self._get_params(query, params)))
 
     def executemany(self, query: QueryBuilder | str, params: list[tuple] | list[list] | None = None) -> DBResult:
-        if isinstance(query, QueryBuilder):
-            self.log(str(query)[:20] + "... (many)")
-        else:
-            self.log(str(query)[:20] + "... (many)")
+        # only the statement is logged, rendering a QueryBuilder with its parameters would be thrown away anyway
+        self.log(self._get_query(query)[:20] + "... (many)")
         return SqliteDBResult(self._con.executemany(self._get_query(query), params or []))
 
     def executescript(self, script: str) -> DBResult:
         self.log("Executing SQL-script")
         return SqliteDBResult(self._con.executescript(script))
 
+    def begin(self):
+        # take the write lock up front instead of upgrading a read lock on the first write
+        self._con.execute("BEGIN IMMEDIATE")
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._con is not None and self._con.in_transaction
+
     def rollback(self):
         self._con.rollback()
 
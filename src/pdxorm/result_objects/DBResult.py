@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from pdxorm.utils import compile_function
+
+
+@lru_cache(maxsize=256)
+def build_dict_converter(columns: tuple[str, ...]) -> Callable[[Iterable[Sequence]], list[dict]]:
+    """
+    Generates the function converting rows with the given column names to dictionaries.
+    Each row becomes a dict display with one index per column, which is faster than dict(zip(columns, row)).
+    The same statements return the same columns, so the functions are cached by the column names.
+    Like dict(zip(...)), the last of several equally named columns wins.
+    """
+    items = ", ".join(f"{name!r}: row[{i}]" for i, name in enumerate(columns))
+    return compile_function("to_dicts", ["def to_dicts(rows):", f"    return [{{{items}}} for row in rows]"])
 
 
 class DBResult(ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -23,6 +39,68 @@ class DBResult(ABC):
         """
         ...
 
+    @property
+    def to_first_dict(self) -> dict | None:
+        """
+        Converts only the first row of the SQL query result to a dictionary.
+
+        Returns:
+            dict | None: The first row with the column names as keys, None if the result is empty.
+        """
+        result = self.to_dict
+        return result[0] if result else None
+
+    @property
+    def to_columns(self) -> dict[str, list]:
+        """
+        Converts the SQL query result to one list of values per column, for consumers reading it column-wise
+        (e.g. aggregations). It avoids building a dictionary per row.
+
+        Returns:
+            dict[str, list]: The column names as keys and the values of all rows in row order as values.
+        """
+        rows = self.to_dict
+        if not rows:
+            return {}
+        return {name: [row[name] for row in rows] for name in rows[0]}
+
+    @staticmethod
+    def _transpose(columns: Sequence[str], rows: list[Sequence]) -> dict[str, list]:
+        """
+        Transposes the rows into one list per column, zip(*rows) does it without a Python loop per value.
+        """
+        if not rows:
+            return {name: [] for name in columns}
+        return dict(zip(columns, map(list, zip(*rows))))
+
+    def iter_dicts(self, batch_size: int = 500) -> Iterator[dict]:
+        """
+        Yields the rows of the SQL query result as dictionaries without building a list of all of them.
+
+        Args:
+            batch_size: The number of rows fetched from the driver at once.
+        """
+        yield from self.to_dict
+
+    def iter_rows(self, batch_size: int = 500) -> Iterator[tuple]:
+        """
+        Yields the rows of the SQL query result without building a list of all of them.
+
+        Args:
+            batch_size: The number of rows fetched from the driver at once.
+        """
+        yield from self.to_list
+
+    def iter_items(self, batch_size: int = 500) -> Iterator[Any]:
+        """
+        Yields the first item of each row of the SQL query result without building a list of all of them.
+
+        Args:
+            batch_size: The number of rows fetched from the driver at once.
+        """
+        for row in self.iter_rows(batch_size):
+            yield row[0]
+
     @property
     @abstractmethod
     def to_item(self) -> Any | None:
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 # Import MySQLdb only if available
 try:
@@ -7,29 +7,68 @@ except ImportError:
     MySQLdb = None
 
 
-from pdxorm import DBResult
+from .DBResult import DBResult, build_dict_converter
 
 
 class MySqlDBResult(DBResult):
+    __slots__ = ("_cursor", "_rows")
+
     def __init__(self, cursor: "MySQLdb.cursors.Cursor"):
         if MySQLdb is None:
             raise ImportError("MySQLdb module is required for MySqlDBResult but not available")
         self._cursor = cursor
+        self._rows: list[tuple] | None = None  # rows fetched by to_list, kept for later reads of the same result
 
     @property
     def to_list(self) -> list[tuple]:
-        return self._cursor.fetchall()
+        if self._rows is None:
+            self._rows = self._cursor.fetchall()
+        return self._rows
 
     @property
     def to_dict(self) -> list[dict]:
-        result = self._cursor.fetchall()
-        return [dict(zip([col[0] for col in self._cursor.description], row)) for row in result]
+        if self._cursor.description is None:
+            return []
+        columns = tuple(col[0] for col in self._cursor.description)
+        return build_dict_converter(columns)(self._remaining_rows())
+
+    @property
+    def to_first_dict(self) -> dict | None:
+        row = self._cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([col[0] for col in self._cursor.description], row))
+
+    @property
+    def to_columns(self) -> dict[str, list]:
+        if self._cursor.description is None:
+            return {}
+        columns = [col[0] for col in self._cursor.description]
+        return self._transpose(columns, self.to_list)
+
+    def iter_dicts(self, batch_size: int = 500) -> Iterator[dict]:
+        # the cursor is shared by the connection, so the rows are taken from it before the first one is yielded
+        rows = self._cursor.fetchall()
+        to_dicts = build_dict_converter(tuple(col[0] for col in self._cursor.description or ()))
+        yield from to_dicts(rows)
+
+    def iter_rows(self, batch_size: int = 500) -> Iterator[tuple]:
+        # the cursor is shared by the connection, so the rows are taken from it before the first one is yielded
+        yield from self._cursor.fetchall()
 
     @property
     def to_item(self) -> Any | None:
-        res = self.to_list
-        return None if not res else res[0][0]
+        if self._rows is not None:
+            return self._rows[0][0] if self._rows else None
+        row = self._cursor.fetchone()
+        return None if row is None else row[0]
 
     @property
     def to_items(self) -> list:
-        return list(map(lambda x: x[0], self.to_list))
+        return [row[0] for row in self._remaining_rows()]
+
+    def _remaining_rows(self) -> Iterable[tuple]:
+        """
+        Returns the rows already fetched by to_list or else the cursor itself, which is iterated without a list.
+        """
+        return self._cursor if self._rows is None else self._rows
@@ -4,20 +4,25 @@ try:
 except ImportError:
     sqlite3 = None
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from .DBResult import DBResult
+from .DBResult import DBResult, build_dict_converter
 
 
 class SqliteDBResult(DBResult):
+    __slots__ = ("_result", "_rows")
+
     def __init__(self, result: "sqlite3.Cursor"):
         if sqlite3 is None:
             raise ImportError("sqlite3 module is required for SqliteDBResult but not available")
         self._result = result
+        self._rows: list[tuple] | None = None  # rows fetched by to_list, kept for later reads of the same result
 
     @property
     def to_list(self) -> list[tuple]:
-        return self._result.fetchall()
+        if self._rows is None:
+            self._rows = self._result.fetchall()
+        return self._rows
 
     @property
     def to_dict(self) -> list[dict]:
@@ -30,8 +35,41 @@ class SqliteDBResult(DBResult):
         Returns:
             list[dict]: A list of dictionaries with the column names as keys and the values of the row as values.
         """
-        result = self._result.fetchall()
-        return [dict(zip([col[0] for col in self._result.description], row)) for row in result]
+        if self._result.description is None:
+            return []
+        columns = tuple(col[0] for col in self._result.description)
+        # the cursor is iterated directly, so the rows are converted without an intermediate list of tuples
+        return build_dict_converter(columns)(self._remaining_rows())
+
+    @property
+    def to_first_dict(self) -> dict | None:
+        row = self._result.fetchone()
+        columns = [col[0] for col in self._result.description]
+        self._result.close()  # finish the statement right away instead of keeping its read lock until cleanup
+        return None if row is None else dict(zip(columns, row))
+
+    @property
+    def to_columns(self) -> dict[str, list]:
+        if self._result.description is None:
+            return {}
+        columns = [col[0] for col in self._result.description]
+        return self._transpose(columns, self.to_list)
+
+    def iter_dicts(self, batch_size: int = 500) -> Iterator[dict]:
+        to_dicts = build_dict_converter(tuple(col[0] for col in self._result.description or ()))
+        try:
+            while rows := self._result.fetchmany(batch_size):
+                yield from to_dicts(rows)
+        finally:
+            # also when the caller stops early, the open statement holds a read lock
+            self._result.close()
+
+    def iter_rows(self, batch_size: int = 500) -> Iterator[tuple]:
+        try:
+            while rows := self._result.fetchmany(batch_size):
+                yield from rows
+        finally:
+            self._result.close()
 
     @property
     def to_item(self) -> Any | None:
@@ -39,8 +77,11 @@ class SqliteDBResult(DBResult):
         :returns: None if result is empty
                   else first item of the first row of the result
         """
-        res = self.to_list
-        return None if not res else res[0][0]
+        if self._rows is not None:
+            return self._rows[0][0] if self._rows else None
+        row = self._result.fetchone()
+        self._result.close()  # like to_first_dict, the remaining rows are not needed and would keep the read lock
+        return None if row is None else row[0]
 
     @property
     def to_items(self) -> list:
@@ -49,4 +90,10 @@ class SqliteDBResult(DBResult):
                   else list of first items of each row of the result
 
         """
-        return list(map(lambda x: x[0], self.to_list))
+        return [row[0] for row in self._remaining_rows()]
+
+    def _remaining_rows(self) -> Iterable[tuple]:
+        """
+        Returns the rows already fetched by to_list or else the cursor itself, which is iterated without a list.
+        """
+        return self._result if self._rows is None else self._rows
@@ -2,9 +2,16 @@ from pdxorm import DatabaseType
 
 DB_IS_INITIALIZED = False
 DB_TYPE: DatabaseType = None  # noqa
+DB_URL: str = None  # noqa  # URL passed to setup_database_from_url
 
 DB_READONLY_PATH = None
 DB_PATH = None
+DB_JOURNAL_MODE: str = None  # noqa  # SQLite only, e.g. "WAL" (?journal_mode=wal), None keeps the database default
+DB_SYNCHRONOUS: str = None  # noqa  # SQLite only, e.g. "NORMAL" (?synchronous=normal), None keeps the default
+# SQLite only, applied to the read and the writable connections, None keeps the default
+DB_TEMP_STORE: str = None  # noqa  # e.g. "MEMORY" (?temp_store=memory)
+DB_CACHE_SIZE: int = None  # noqa  # pages, or KiB if negative, e.g. -65536 for 64 MiB (?cache_size=-65536)
+DB_MMAP_SIZE: int = None  # noqa  # bytes of the database file read through memory mapping (?mmap_size=268435456)
 
 DB_HOST = None
 DB_PORT = None
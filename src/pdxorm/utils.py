@@ -27,12 +27,35 @@ def get_as_tuple[T](value: T) -> tuple[T, ...]:
     return (value,)
 
 
-def get_elements_as_list[T](data: T | list[T], consumer: Callable[[T], Any] = lambda x: x) -> list[Any]:
+def get_elements_as_list[T](data: T | list[T], consumer: Callable[[T], Any] | None = None) -> list[Any]:
     """
     Applies the consumer function to the data and returns the result as a list.
     If the data is a list, applies the consumer to each element and returns a list of results.
     If the data is a single element, applies the consumer to it and returns a list with the result.
+    Without a consumer the elements are returned as they are.
     """
+    if consumer is None:
+        return list(data) if isinstance(data, list) else [data]
     if isinstance(data, list):
-        return [consumer(d) for d in data]
+        return list(map(consumer, data))
     return [consumer(data)]
+
+
+def is_type_or_list_type(value: Any, expected_type: Any) -> bool:
+    """
+    Check if the value is of the expected type or a list of the expected type.
+    """
+    if isinstance(value, list):
+        return all(isinstance(item, expected_type) for item in value)
+    return isinstance(value, expected_type)
+
+
+def compile_function(name: str, lines: list[str], namespace: dict[str, Any] | None = None) -> Callable:
+    """
+    Executes the generated source of a function and returns the function with the given name.
+    The namespace holds the globals the source refers to.
+    Column and field names must only enter the source through repr(), so they can never be read as code.
+    """
+    namespace = {} if namespace is None else namespace
+    exec("\n".join(lines), namespace)
+    return namespace[name]
@@ -0,0 +1,354 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import pdxorm
+from pdxorm import AbstractSchema, AbstractTable, BaseData, ConnectionHandler, DBColumn, DatabaseType
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test_AbstractTable.db")
+
+SCHEMA_SQL = """
+DROP TABLE IF EXISTS grp_member;
+DROP TABLE IF EXISTS person;
+DROP TABLE IF EXISTS badge;
+DROP TABLE IF EXISTS region;
+CREATE TABLE grp_member (id INTEGER PRIMARY KEY, grp_key TEXT, label TEXT);
+CREATE TABLE person (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, grp_key TEXT);
+CREATE TABLE badge (id INTEGER PRIMARY KEY, member_id INTEGER);
+CREATE TABLE region (country TEXT, rid INTEGER, label TEXT, population INTEGER, PRIMARY KEY (country, rid));
+INSERT INTO grp_member VALUES (1, 'g1', 'first'), (2, 'g1', 'second'), (3, 'g2', 'third');
+INSERT INTO person (id, name, grp_key) VALUES (1, 'a', 'g1'), (2, 'b', 'g1'), (3, 'c', 'g2');
+INSERT INTO badge VALUES (1, 1), (2, 2), (3, 3);
+INSERT INTO region VALUES ('de', 1, 'north', 10), ('de', 2, 'south', 20), ('at', 1, 'north', 30);
+"""
+
+
+table_module = sys.modules["pdxorm.AbstractTable"]
+
+
+def setUpModule():
+    pdxorm.setup_database_from_url("sqlite://" + DB_PATH, DatabaseType.SQLITE)
+
+
+class MemberSchema(AbstractSchema):
+    @property
+    def table_name(self):
+        return "grp_member" + self._alias_external()
+
+    @property
+    def table_name_no_alias(self):
+        return "grp_member"
+
+    @property
+    def select(self):
+        return f"SELECT {self._alias_internal()}id, {self._alias_internal()}grp_key, {self._alias_internal()}label"
+
+    @property
+    def columns(self):
+        return ("id", "grp_key", "label")
+
+    @property
+    def primaryKey(self):
+        return ("id",)
+
+
+class MemberData(BaseData):
+    id: int = DBColumn("id", "id", False, None, primary_key=True)
+    grp_key: str = DBColumn("grp_key", "grp_key", False, None)
+    label: str = DBColumn("label", "label", False, None)
+
+
+class MemberTable(AbstractTable[MemberData, int]):
+    schema = MemberSchema("m")
+    dataclass = MemberData
+
+
+class CachedMemberSchema(MemberSchema):
+    cacheable = True
+
+
+class CachedMemberTable(AbstractTable[MemberData, int]):
+    schema = CachedMemberSchema("m")
+    dataclass = MemberData
+
+
+class BadgeSchema(AbstractSchema):
+    @property
+    def table_name(self):
+        return "badge" + self._alias_external()
+
+    @property
+    def table_name_no_alias(self):
+        return "badge"
+
+    @property
+    def select(self):
+        return f"SELECT {self._alias_internal()}id, {self._alias_internal()}member_id"
+
+    @property
+    def columns(self):
+        return ("id", "member_id")
+
+    @property
+    def primaryKey(self):
+        return ("id",)
+
+
+class BadgeData(BaseData):
+    id: int = DBColumn("id", "id", False, None, primary_key=True)
+    member: MemberData = DBColumn("member", "member_id", True, CachedMemberTable)
+
+
+class BadgeTable(AbstractTable[BadgeData, int]):
+    schema = BadgeSchema("b")
+    dataclass = BadgeData
+
+
+class RegionSchema(AbstractSchema):
+    @property
+    def table_name(self):
+        return "region" + self._alias_external()
+
+    @property
+    def table_name_no_alias(self):
+        return "region"
+
+    @property
+    def select(self):
+        return (f"SELECT {self._alias_internal()}country, {self._alias_internal()}rid, "
+                f"{self._alias_internal()}label, {self._alias_internal()}population")
+
+    @property
+    def columns(self):
+        return ("country", "rid", "label", "population")
+
+    @property
+    def primaryKey(self):
+        return ("country", "rid")
+
+
+class RegionData(BaseData):
+    country: str = DBColumn("country", "country", False, None, primary_key=True)
+    rid: int = DBColumn("rid", "rid", False, None, primary_key=True)
+    label: str = DBColumn("label", "label", False, None)
+    population: int = DBColumn("population", "population", False, None)
+
+
+class RegionTable(AbstractTable[RegionData, tuple]):
+    schema = RegionSchema("r")
+    dataclass = RegionData
+
+
+class PersonSchema(AbstractSchema):
+    @property
+    def table_name(self):
+        return "person" + self._alias_external()
+
+    @property
+    def table_name_no_alias(self):
+        return "person"
+
+    @property
+    def select(self):
+        return f"SELECT {self._alias_internal()}id, {self._alias_internal()}name, {self._alias_internal()}grp_key"
+
+    @property
+    def columns(self):
+        return ("id", "name", "grp_key")
+
+    @property
+    def primaryKey(self):
+        return ("id",)
+
+
+class PersonData(BaseData):
+    id: int = DBColumn("id", "id", False, None, primary_key=True, auto_generated=True)
+    name: str = DBColumn("name", "name", False, None)
+    grp: list[MemberData] = DBColumn("grp", "grp_key", True, MemberTable, referenced_column="grp_key")
+
+
+class PersonTable(AbstractTable[PersonData, int]):
+    schema = PersonSchema("p")
+    dataclass = PersonData
+
+
+class GroupedPersonData(BaseData):
+    # the update of one-to-many fields reads them by their column name
+    id: int = DBColumn("id", "id", False, None, primary_key=True, auto_generated=True)
+    name: str = DBColumn("name", "name", False, None)
+    grp_key: list[MemberData] = DBColumn("grp_key", "grp_key", True, MemberTable, referenced_column="grp_key")
+
+
+class GroupedPersonTable(AbstractTable[GroupedPersonData, int]):
+    schema = PersonSchema("p")
+    dataclass = GroupedPersonData
+
+
+class AbstractTableTests(unittest.TestCase):
+    def setUp(self):
+        con = sqlite3.connect(DB_PATH)
+        con.executescript(SCHEMA_SQL)
+        con.close()
+        table_module._reference_cache.clear()
+
+    def test_one_to_many_lists_are_not_shared_between_rows(self):
+        first, second, _ = PersonTable().get_all()
+        self.assertEqual([member.id for member in first.grp], [1, 2])
+        self.assertEqual(first.grp, second.grp)
+        self.assertIsNot(first.grp, second.grp)
+
+        first.grp.pop()
+        self.assertEqual([member.id for member in second.grp], [1, 2])
+
+    def test_every_write_clears_the_reference_cache(self):
+        badges = BadgeTable().get_all()
+        self.assertEqual([badge.member.label for badge in badges], ["first", "second", "third"])
+        self.assertEqual(len(table_module._reference_cache[CachedMemberTable]), 3)
+
+        # a write to another table clears the cache too, cached rows may embed its rows
+        PersonTable().execute("UPDATE person SET name = ? WHERE id = ?", ("x", 1))
+        self.assertEqual(table_module._reference_cache, {})
+
+    def test_reference_cache_evicts_the_least_recently_used_row(self):
+        table = BadgeTable()
+        with patch.object(table_module, "REFERENCE_CACHE_SIZE", 2):
+            table.get_one(1)
+            table.get_one(2)
+            table.get_one(1)
+            table.get_one(3)
+
+        self.assertEqual(list(table_module._reference_cache[CachedMemberTable]), [(1,), (3,)])
+
+    def test_reference_cache_is_shared_by_threads(self):
+        errors = []
+
+        def load():
+            try:
+                for _ in range(20):
+                    for badge in BadgeTable().get_all():
+                        self.assertEqual(badge.member.id, badge.id)
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        with patch.object(table_module, "REFERENCE_CACHE_SIZE", 2):
+            threads = [threading.Thread(target=load) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(table_module._reference_cache[CachedMemberTable]), 2)
+
+    def test_update_of_a_missing_key_raises(self):
+        table = PersonTable()
+        person = table.get_one(1)
+        person.id = 99
+
+        with self.assertRaisesRegex(ValueError, "No data found for key"):
+            table.update(person)
+
+    def test_update_many_with_different_changed_columns(self):
+        table = RegionTable()
+        north, south, austria = table.get_all()
+        north.label = "n"
+        south.population = 21
+        austria.label = "a"
+        austria.population = 31
+
+        table.update_many([north, south, austria])
+
+        rows = [(r.country, r.rid, r.label, r.population) for r in table.get_all()]
+        self.assertEqual(rows, [("de", 1, "n", 10), ("de", 2, "south", 21), ("at", 1, "a", 31)])
+
+    def test_update_with_composite_primary_key(self):
+        table = RegionTable()
+        region = table.get_one(("at", 1))
+        self.assertEqual(region.pk, ("at", 1))
+        region.label = "east"
+
+        table.update(region)
+
+        self.assertEqual(table.get_one(("at", 1)).label, "east")
+        self.assertEqual(table.get_one(("de", 1)).label, "north")
+
+    def test_update_many_rolls_back_when_a_one_to_many_field_changed(self):
+        table = GroupedPersonTable()
+        first, second, _ = table.get_all()
+        first.name = "changed"
+        # the children of another group change the one-to-many key, which has to be updated in its own table
+        second.grp_key = MemberTable().get_data_with_where("grp_key = 'g2'")
+
+        with self.assertRaisesRegex(ValueError, "Cannot update one-to-many fields directly"):
+            table.update_many([first, second])
+
+        self.assertEqual(table.get_one(1).name, "a")
+
+    def test_insert_many_with_generated_and_explicit_ids(self):
+        table = PersonTable()
+        table.insert_many([PersonData(name="d"), PersonData(id=10, name="e"), PersonData(name="f")])
+
+        names = {person.id: person.name for person in table.get_all()}
+        self.assertEqual(names[10], "e")
+        self.assertEqual(sorted(names.values()), ["a", "b", "c", "d", "e", "f"])
+
+    def test_insert_many_without_rows_does_nothing(self):
+        PersonTable().insert_many([])
+        self.assertEqual(len(PersonTable().get_all()), 3)
+
+    def test_get_data_with_query_iter_resolves_every_batch(self):
+        table = PersonTable()
+        query = "SELECT p.id, p.name, p.grp_key FROM person AS p ORDER BY p.id"
+        with patch.object(table_module, "STREAM_BATCH_SIZE", 2):
+            people = list(table.get_data_with_query_iter(query))
+
+        self.assertEqual([person.name for person in people], ["a", "b", "c"])
+        self.assertEqual([[member.id for member in person.grp] for person in people], [[1, 2], [1, 2], [3]])
+        self.assertEqual(people, table.get_all())
+
+    def test_closing_the_iterator_releases_the_read_lock(self):
+        people = PersonTable().get_data_with_query_iter("SELECT p.id, p.name, p.grp_key FROM person AS p")
+        self.assertEqual(next(people).name, "a")
+        people.close()
+
+        # with the statement still open the insert would wait for the busy timeout and fail with "database is locked"
+        PersonTable().insert(PersonData(name="d"))
+        self.assertEqual(len(PersonTable().get_all()), 4)
+
+    def test_write_during_iteration_in_wal_mode(self):
+        con = sqlite3.connect(DB_PATH)
+        con.execute("PRAGMA journal_mode = WAL")
+        con.close()
+        try:
+            names = []
+            with patch.object(table_module, "STREAM_BATCH_SIZE", 1):
+                for person in PersonTable().get_data_with_query_iter(
+                        "SELECT p.id, p.name, p.grp_key FROM person AS p ORDER BY p.id"):
+                    names.append(person.name)
+                    if person.id == 1:
+                        PersonTable().execute("UPDATE person SET name = ? WHERE id = ?", ("x", 3))
+        finally:
+            # leaving WAL mode needs the only connection to the database
+            ConnectionHandler.close_all_connections()
+            con = sqlite3.connect(DB_PATH)
+            con.execute("PRAGMA journal_mode = DELETE")
+            con.close()
+
+        self.assertEqual(names[:2], ["a", "b"])
+        self.assertEqual(PersonTable().get_one(3).name, "x")
+
+    def test_write_right_after_to_item(self):
+        table = PersonTable()
+        result = table.execute_select_query("SELECT name FROM person ORDER BY id")
+        self.assertEqual(result.to_item, "a")
+
+        # the other rows are still unread, an open statement would block the write until the busy timeout
+        with table_module.Connection() as conn:
+            conn.execute("PRAGMA busy_timeout = 0")
+            conn.execute("UPDATE person SET name = ? WHERE id = ?", ("x", 2))
+            conn.execute("PRAGMA busy_timeout = 5000")
+        self.assertEqual(table.get_one(2).name, "x")
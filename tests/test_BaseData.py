@@ -41,6 +41,12 @@ class BaseDataTest(unittest.TestCase):
         self.assertNotEqual(self.test_data, self.test_data2)
         self.assertNotEqual(self.test_data, None)
 
+    def test_equal_compares_foreign_keys_by_db_value(self):
+        lazy = newTestData.from_db_dict({"id": 1, "name": "tum tum tum", "foreign_key": 1})
+        self.assertEqual(self.test_with_fk, lazy)
+        self.assertNotEqual(self.test_with_fk, newTestData(id=1, name="tum tum tum", foreign_key={"id": 2, "name": "x"}))
+        self.assertNotEqual(self.test_data2, self.test_data3)
+
     def test_repr(self):
         self.assertEqual(repr(self.test_data), "TestData(Pk[x=1])")
 
@@ -124,6 +130,21 @@ class BaseDataTest(unittest.TestCase):
         self.assertEqual(obj.y, "hallo")
         self.assertEqual(obj.z, "moin moin")
 
+    def test_from_db_dicts_keeps_row_order_and_wraps_unresolved_references(self):
+        rows = [{"id": 1, "name": "a", "foreign_key": 5}, {"id": 2, "name": "b", "foreign_key": None}]
+        first, second = newTestData.from_db_dicts(rows)
+        self.assertEqual((first.id, first.name, second.id, second.name), (1, "a", 2, "b"))
+        self.assertEqual(first.get_db_value("foreign_key"), (5,))
+        self.assertIsNone(second.foreign_key)
+
+    def test_unloaded_reference_raises_attribute_error(self):
+        lazy = newTestData.from_db_dict({"id": 1, "name": "a", "foreign_key": 5})
+        with self.assertRaises(AttributeError):
+            _ = lazy.foreign_key
+        self.assertFalse(hasattr(lazy, "foreign_key"))
+        lazy.foreign_key = ForeignKeyData(id=5, name="fk")
+        self.assertEqual(lazy.foreign_key.name, "fk")
+
     def test_get_as_db_name(self):
         self.assertEqual(self.test_data.get_as_db_name("x"), 1)
         self.assertEqual(self.test_data.get_as_db_name("tralalero"), "test")
@@ -143,3 +164,40 @@ class BaseDataTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             columns = ["non_existing_column"]
             values = self.test_data.get_values_for_columns(columns)
+
+    def test_updatable_fields_exclude_primary_keys(self):
+        self.assertEqual(TestData.meta().updatable_fields, (("y", ("tralalero",)), ("z", ("tralala",))))
+        self.assertEqual(newTestData.meta().updatable_fields, (("name", ("name",)), ("foreign_key", ("foreign_key",))))
+
+    def test_auto_generated_columns_map_attribute_to_db_column(self):
+        class AutoData(BaseData):
+            key: int = DBColumn("key", "row_id", False, None, primary_key=True, auto_generated=True)
+            name: str = DBColumn("name", "name", False, None)
+
+        self.assertEqual(AutoData.meta().auto_generated_columns, (("key", "row_id"),))
+        self.assertEqual(TestData.meta().auto_generated_columns, ())
+
+    def test_pk_of_composite_keys(self):
+        class CompositeData(BaseData):
+            country: str = DBColumn("country", "country", False, None, primary_key=True)
+            name: str = DBColumn("name", "name", False, None)
+            rid: int = DBColumn("rid", "region_id", False, None, primary_key=True)
+
+        data = CompositeData(country="de", name="north", rid=1)
+        self.assertEqual(data.pk, ("de", 1))
+        self.assertEqual(data.primary_key, ("de", 1))
+        self.assertIsNotNone(CompositeData.meta().primary_key_getter)
+
+    def test_pk_of_reference_keys_uses_the_db_value(self):
+        class PositionData(BaseData):
+            parent: ForeignKeyData = DBColumn("parent", "parent_id", False, testDb, primary_key=True)
+            pos: int = DBColumn("pos", "pos", False, None, primary_key=True)
+
+        parent = ForeignKeyData(id=3, name="parent")
+        data = PositionData(parent=parent, pos=1)
+        self.assertEqual(data.pk, (3, 1))
+        self.assertEqual(data.primary_key, (parent, 1))
+        self.assertIsNone(PositionData.meta().primary_key_getter)
+
+        lazy = PositionData.from_db_dict({"parent_id": 5, "pos": 2})
+        self.assertEqual(lazy.pk, (5, 2))
@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pdxorm
+from pdxorm import Connection, ConnectionHandler, DatabaseType, settings
+
+
+def setUpModule():
+    # the settings are global, so another test module may already have set up its database
+    pdxorm.setup_database_from_url("sqlite://" + os.path.join(tempfile.mkdtemp(), "test_Connection.db"),
+                                   DatabaseType.SQLITE)
+
+
+class ConnectionTests(unittest.TestCase):
+    def setUp(self):
+        con = sqlite3.connect(settings.DB_PATH)
+        con.executescript("""
+        DROP TABLE IF EXISTS connection_test;
+        CREATE TABLE connection_test (id INTEGER PRIMARY KEY);
+        INSERT INTO connection_test VALUES (1), (2);
+        """)
+        con.close()
+
+    def _rows(self) -> list[tuple]:
+        con = sqlite3.connect(settings.DB_PATH)
+        try:
+            return con.execute("SELECT id FROM connection_test").fetchall()
+        finally:
+            con.close()
+
+    def test_failed_commit_rolls_back_and_the_next_transaction_works(self):
+        reader = sqlite3.connect(settings.DB_PATH)
+        # the unfinished statement keeps a SHARED lock, so COMMIT cannot get the EXCLUSIVE one
+        cursor = reader.execute("SELECT id FROM connection_test")
+        try:
+            with self.assertRaisesRegex(sqlite3.OperationalError, "locked"):
+                with Connection() as conn:
+                    conn.execute("PRAGMA busy_timeout = 0")
+                    conn.execute("INSERT INTO connection_test VALUES (3)")
+        finally:
+            cursor.close()
+            reader.close()
+
+        with Connection() as conn:
+            conn.execute("PRAGMA busy_timeout = 5000")
+            conn.execute("INSERT INTO connection_test VALUES (4)")
+        self.assertEqual(len(self._rows()), 3)
+
+    def test_connection_is_discarded_when_the_rollback_fails(self):
+        with Connection() as conn:
+            broken = conn
+
+        with patch.object(broken, "rollback", side_effect=sqlite3.OperationalError("disk I/O error")):
+            with self.assertRaises(ValueError):
+                with Connection():
+                    raise ValueError("failed")
+
+        with Connection() as conn:
+            self.assertIsNot(conn, broken)
+            conn.execute("INSERT INTO connection_test VALUES (3)")
+        self.assertEqual(len(self._rows()), 3)
+        self.assertNotIn(broken, ConnectionHandler._open_connections)
+
+    def test_transaction_left_open_is_rolled_back_before_begin(self):
+        with Connection() as conn:
+            pooled = conn
+        # a transaction left open outside of Connection, e.g. by a commit that failed and was not rolled back
+        pooled.execute("BEGIN")
+        pooled.execute("INSERT INTO connection_test VALUES (3)")
+
+        with self.assertLogs(pdxorm.ORM_LOGGER_NAME, "WARNING"):
+            with Connection() as conn:
+                self.assertIs(conn, pooled)
+                conn.execute("INSERT INTO connection_test VALUES (4)")
+        self.assertEqual(sorted(row[0] for row in self._rows()), [1, 2, 4])
@@ -0,0 +1,31 @@
+import unittest
+
+from pdxorm.IdentityMap import IdentityMap
+
+
+class IdentityMapTests(unittest.TestCase):
+    def test_nothing_is_cached_outside_of_a_context(self):
+        IdentityMap.add(object, (1,), "row")
+        self.assertIsNone(IdentityMap.get(object, (1,)))
+
+    def test_caches_rows_per_table_and_key(self):
+        with IdentityMap():
+            IdentityMap.add(int, (1,), "int row")
+            IdentityMap.add(str, (1,), "str row")
+            self.assertEqual(IdentityMap.get(int, (1,)), "int row")
+            self.assertEqual(IdentityMap.get(str, (1,)), "str row")
+            self.assertIsNone(IdentityMap.get(int, (2,)))
+        self.assertIsNone(IdentityMap.get(int, (1,)))
+
+    def test_nested_contexts_share_the_outer_map(self):
+        with IdentityMap():
+            IdentityMap.add(int, (1,), "row")
+            with IdentityMap():
+                self.assertEqual(IdentityMap.get(int, (1,)), "row")
+            self.assertEqual(IdentityMap.get(int, (1,)), "row")
+
+    def test_clear_removes_all_rows(self):
+        with IdentityMap():
+            IdentityMap.add(int, (1,), "row")
+            IdentityMap.clear()
+            self.assertIsNone(IdentityMap.get(int, (1,)))
@@ -0,0 +1,41 @@
+import unittest
+
+from pdxorm.QueryBuilder import QueryBuilder
+
+
+class QueryBuilderTests(unittest.TestCase):
+    def test_where_or_and_starts_with_where(self):
+        query = QueryBuilder().append("SELECT * FROM t").appendWhereOrAnd("a = ?", 1).appendWhereOrAnd("b = ?", 2)
+
+        self.assertEqual(query.query, "SELECT * FROM t WHERE a = ? AND b = ?")
+        self.assertEqual(query.params, [1, 2])
+
+    def test_where_or_and_continues_a_where_clause(self):
+        query = QueryBuilder().append("SELECT * FROM t").where("a = ?", 1).appendWhereOrAnd("b = ?", 2)
+        self.assertEqual(query.query, "SELECT * FROM t WHERE a = ? AND b = ?")
+        self.assertEqual(query.params, [1, 2])
+
+        query = QueryBuilder().append("SELECT * FROM t").append(QueryBuilder().where("a = 1"))
+        query.appendWhereOrAnd("b = ?", 2)
+        self.assertEqual(query.query, "SELECT * FROM t WHERE a = 1 AND b = ?")
+
+    def test_where_in_a_text_fragment_is_not_taken_for_the_clause(self):
+        query = (
+            QueryBuilder()
+            .append("SELECT * FROM (SELECT id FROM t WHERE a = 1) p")
+            .appendWhereOrAnd("p.note = 'WHERE'")
+        )
+        self.assertEqual(query.query, "SELECT * FROM (SELECT id FROM t WHERE a = 1) p WHERE p.note = 'WHERE'")
+
+    def test_where_in_parentheses_belongs_to_the_subquery(self):
+        subquery = QueryBuilder().append("SELECT id FROM t").appendWhereOrAnd("a = ?", 1)
+        query = (
+            QueryBuilder()
+            .append("SELECT * FROM")
+            .appendInParentheses(subquery)
+            .append("p")
+            .appendWhereOrAnd("p.id = ?", 2)
+        )
+
+        self.assertEqual(query.query, "SELECT * FROM ( SELECT id FROM t WHERE a = ? ) p WHERE p.id = ?")
+        self.assertEqual(query.params, [1, 2])
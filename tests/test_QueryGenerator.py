@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import MagicMock
 
 from pdxorm.AbstractSchema import AbstractSchema
-from pdxorm.QueryGenerator import generate_join, generate_where_with_pk
+from pdxorm.QueryGenerator import generate_join, generate_query_with_pk, generate_where_with_pk
 
 
 class QueryGeneratorTests(unittest.TestCase):
@@ -76,3 +76,19 @@ class QueryGeneratorTests(unittest.TestCase):
 
         self.assertEqual(query.query, "WHERE ")
         self.assertEqual(query.params, [])
+
+    def test_query_with_pk_reuses_template_and_binds_key(self):
+        schema = MagicMock(spec=AbstractSchema)
+        schema.primaryKey = ["id"]
+        schema.alias = "t"
+        schema.select = "SELECT t.id"
+        schema.table_name = "table AS t"
+
+        first = generate_query_with_pk(schema, (1,))
+        second = generate_query_with_pk(schema, (2,))
+
+        self.assertEqual(first.query, "SELECT t.id FROM table AS t WHERE t.id = ?")
+        self.assertIs(first.query, second.query)
+        self.assertEqual(first.params, [1])
+        self.assertEqual(second.params, [2])
+
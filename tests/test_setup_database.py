@@ -0,0 +1,90 @@
+import unittest
+
+import pdxorm
+from pdxorm import DatabaseType, settings
+
+
+class PragmaValueTests(unittest.TestCase):
+    def test_known_values_are_upper_cased(self):
+        config = {"journal_mode": "wal", "synchronous": "Normal", "temp_store": "memory"}
+
+        self.assertEqual(pdxorm._get_pragma_value(config, "journal_mode", pdxorm.SQLITE_JOURNAL_MODES), "WAL")
+        self.assertEqual(pdxorm._get_pragma_value(config, "synchronous", pdxorm.SQLITE_SYNCHRONOUS_MODES), "NORMAL")
+        self.assertEqual(pdxorm._get_pragma_value(config, "temp_store", pdxorm.SQLITE_TEMP_STORE_MODES), "MEMORY")
+
+    def test_missing_value_is_none(self):
+        self.assertIsNone(pdxorm._get_pragma_value({}, "journal_mode", pdxorm.SQLITE_JOURNAL_MODES))
+        self.assertIsNone(pdxorm._get_int_pragma_value({}, "cache_size"))
+
+    def test_unknown_values_raise(self):
+        cases = [
+            ("journal_mode", "wal; DROP TABLE person", pdxorm.SQLITE_JOURNAL_MODES),
+            ("synchronous", "sometimes", pdxorm.SQLITE_SYNCHRONOUS_MODES),
+            ("temp_store", "disk", pdxorm.SQLITE_TEMP_STORE_MODES),
+        ]
+        for key, value, allowed in cases:
+            with self.subTest(key=key), self.assertRaisesRegex(ValueError, f"Unsupported {key}"):
+                pdxorm._get_pragma_value({key: value}, key, allowed)
+
+    def test_int_values(self):
+        config = {"cache_size": "-65536", "mmap_size": "268435456"}
+
+        self.assertEqual(pdxorm._get_int_pragma_value(config, "cache_size"), -65536)
+        self.assertEqual(pdxorm._get_int_pragma_value(config, "mmap_size"), 268435456)
+
+    def test_non_integer_values_raise(self):
+        for key in ("cache_size", "mmap_size"):
+            with self.subTest(key=key), self.assertRaisesRegex(ValueError, f"Unsupported {key}: 1e3"):
+                pdxorm._get_int_pragma_value({key: "1e3"}, key)
+
+
+class SetupDatabaseFromUrlTests(unittest.TestCase):
+    def setUp(self):
+        # the settings are global, other test modules set them up too
+        self._settings = {name: value for name, value in vars(settings).items() if name.startswith("DB_")}
+        settings.DB_IS_INITIALIZED = False
+
+    def tearDown(self):
+        for name, value in self._settings.items():
+            setattr(settings, name, value)
+
+    def test_sqlite_url_sets_the_pragmas(self):
+        pdxorm.setup_database_from_url(
+            "sqlite:///tmp/test.db?journal_mode=wal&synchronous=normal&temp_store=memory"
+            "&cache_size=-2000&mmap_size=4096", DatabaseType.SQLITE)
+
+        self.assertEqual(settings.DB_PATH, "/tmp/test.db")
+        self.assertEqual(settings.DB_JOURNAL_MODE, "WAL")
+        self.assertEqual(settings.DB_SYNCHRONOUS, "NORMAL")
+        self.assertEqual(settings.DB_TEMP_STORE, "MEMORY")
+        self.assertEqual(settings.DB_CACHE_SIZE, -2000)
+        self.assertEqual(settings.DB_MMAP_SIZE, 4096)
+
+    def test_first_of_duplicate_parameters_wins(self):
+        pdxorm.setup_database_from_url("sqlite:///tmp/test.db?journal_mode=wal&journal_mode=delete&cache_size=1"
+                                       "&cache_size=2", DatabaseType.SQLITE)
+
+        self.assertEqual(settings.DB_JOURNAL_MODE, "WAL")
+        self.assertEqual(settings.DB_CACHE_SIZE, 1)
+
+    def test_invalid_parameter_leaves_the_database_uninitialized(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported synchronous"):
+            pdxorm.setup_database_from_url("sqlite:///tmp/test.db?synchronous=never", DatabaseType.SQLITE)
+
+        self.assertFalse(settings.DB_IS_INITIALIZED)
+
+    def test_same_url_again_is_silently_ignored(self):
+        url = "sqlite:///tmp/test.db?journal_mode=wal"
+        pdxorm.setup_database_from_url(url, DatabaseType.SQLITE)
+
+        with self.assertNoLogs(pdxorm.ORM_LOGGER_NAME):
+            pdxorm.setup_database_from_url(url, DatabaseType.SQLITE)
+        self.assertEqual(settings.DB_URL, url)
+
+    def test_other_url_is_skipped_with_a_warning(self):
+        pdxorm.setup_database_from_url("sqlite:///tmp/test.db", DatabaseType.SQLITE)
+
+        with self.assertLogs(pdxorm.ORM_LOGGER_NAME, "WARNING"):
+            pdxorm.setup_database_from_url("sqlite:///tmp/other.db?journal_mode=wal", DatabaseType.SQLITE)
+        self.assertEqual(settings.DB_PATH, "/tmp/test.db")
+        self.assertIsNone(settings.DB_JOURNAL_MODE)
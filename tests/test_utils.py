@@ -0,0 +1,19 @@
+import unittest
+
+from pdxorm.utils import compile_function
+
+
+class CompileFunctionTests(unittest.TestCase):
+    def test_returns_the_named_function(self):
+        add = compile_function("add", ["def add(a, b):", "    return a + b"])
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add.__name__, "add")
+
+    def test_source_reads_the_given_namespace(self):
+        offset = compile_function("offset", ["def offset(a):", "    return a + base"], {"base": 10})
+        self.assertEqual(offset(1), 11)
+
+    def test_names_entered_through_repr_stay_strings(self):
+        name = "x'] or __import__('os') or values['"
+        getter = compile_function("getter", ["def getter(values):", f"    return values[{name!r}]"])
+        self.assertEqual(getter({name: 1}), 1)